@@ -261,10 +261,18 @@ run_e2e_tests() {
     fi
     
     # Run the exact same pytest command as CI
+    local pytest_args="tests/integration/test_golden_scenario_e2e.py -v -s --tb=short -n 2 --dist loadgroup -p no:cacheprovider"
+    
+    # Test homes and projects all live under pytest's base temp directory; keep it
+    # on tmpfs when there is room for the runtime installs (4 GiB)
+    if [[ -d /dev/shm && -w /dev/shm ]] && (( $(df -Pk /dev/shm | awk 'NR==2 {print $4}') > 4194304 )); then
+        pytest_args="$pytest_args --basetemp=/dev/shm/apm-e2e"
+    fi
+    
     log_info "Running pytest command (same as CI)..."
-    echo "Command: pytest tests/integration/test_golden_scenario_e2e.py -v -s --tb=short"
+    echo "Command: pytest $pytest_args"
     
-    if pytest tests/integration/test_golden_scenario_e2e.py -v -s --tb=short; then
+    if pytest $pytest_args; then
         log_success "Integration tests passed!"
     else
         log_error "Integration tests failed!"
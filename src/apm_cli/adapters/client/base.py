@@ -34,3 +34,19 @@ class MCPClientAdapter(ABC):
             bool: True if successful, False otherwise.
         """
         pass
+
+    def configure_mcp_servers(self, server_urls):
+        """Configure several MCP servers in the client configuration.
+
+        Adapters can override this to apply all servers in a single write.
+
+        Args:
+            server_urls (list): URLs of the MCP servers.
+
+        Returns:
+            list: URLs of the servers that were configured.
+        """
+        return [
+            server_url for server_url in server_urls
+            if self.configure_mcp_server(server_url, server_name=server_url)
+        ]
@@ -11,6 +11,94 @@ from pathlib import Path
 from .base import MCPClientAdapter
 from ...registry.client import SimpleRegistryClient
 from ...registry.integration import RegistryIntegration
+from ...utils.json_io import dumps, loads
+
+
+def _package_kind(runtime_hint, registry_name):
+    """Classify a registry package by how its MCP server is launched.
+    
+    Args:
+        runtime_hint (str): Runtime hint of the package.
+        registry_name (str): Lowercased name of the package registry.
+        
+    Returns:
+        str: "npm", "docker" or "python", or None if the package is not supported.
+    """
+    if runtime_hint == "npx" or "npm" in registry_name:
+        return "npm"
+    if runtime_hint == "docker":
+        return "docker"
+    if runtime_hint in ("uvx", "pip", "python") or "python" in runtime_hint or registry_name == "pypi":
+        return "python"
+    return None
+
+
+def _required_args(package):
+    """Get the required runtime argument values of a package.
+    
+    Args:
+        package (dict): Package information from registry.
+        
+    Returns:
+        list: Value hints of the required runtime arguments.
+    """
+    return [
+        arg.get("value_hint")
+        for arg in package.get("runtime_arguments") or ()
+        if arg.get("is_required", False) and arg.get("value_hint")
+    ]
+
+
+def _format_npm_package(package, runtime_hint):
+    """Format an npm package as an npx-launched server."""
+    args = _required_args(package)
+    
+    # Fallback if no runtime_arguments are provided
+    if not args and package.get("name"):
+        args = [package.get("name")]
+    
+    return {"type": "stdio", "command": "npx", "args": args}
+
+
+def _format_docker_package(package, runtime_hint):
+    """Format a docker package as a docker-launched server."""
+    # Fallback if no runtime_arguments are provided - use standard docker run command
+    args = _required_args(package) or ["run", "-i", "--rm", package.get("name")]
+    
+    return {"type": "stdio", "command": "docker", "args": args}
+
+
+def _format_python_package(package, runtime_hint):
+    """Format a Python package as a uvx- or python-launched server."""
+    # Determine the command based on runtime_hint
+    if runtime_hint == "uvx":
+        command = "uvx"
+    elif "python" in runtime_hint:
+        # Use the specified Python path if it's a full path, otherwise default to python3
+        command = "python3" if runtime_hint in ["python", "pip"] else runtime_hint
+    else:
+        command = "python3"
+    
+    args = _required_args(package)
+    
+    # Fallback if no runtime_arguments are provided
+    if not args:
+        if runtime_hint == "uvx":
+            module_name = package.get("name", "").replace("mcp-server-", "")
+            args = [f"mcp-server-{module_name}"]
+        else:
+            module_name = package.get("name", "").replace("mcp-server-", "").replace("-", "_")
+            args = ["-m", f"mcp_server_{module_name}"]
+    
+    return {"type": "stdio", "command": command, "args": args}
+
+
+# Server config formatters by package kind, see _package_kind
+_PACKAGE_FORMATTERS = {
+    "npm": _format_npm_package,
+    "docker": _format_docker_package,
+    "python": _format_python_package,
+}
 
 
 class VSCodeClientAdapter(MCPClientAdapter):
@@ -68,8 +156,8 @@ class VSCodeClientAdapter(MCPClientAdapter):
         try:
             # Read existing config or create a new one
             try:
-                with open(config_path, "r", encoding="utf-8") as f:
-                    config = json.load(f)
+                with open(config_path, "rb") as f:
+                    config = loads(f.read())
             except (FileNotFoundError, json.JSONDecodeError):
                 config = {}
             
@@ -84,7 +172,7 @@ class VSCodeClientAdapter(MCPClientAdapter):
                 
             # Write the updated config
             with open(config_path, "w", encoding="utf-8") as f:
-                json.dump(config, f, indent=2)
+                f.write(dumps(config))
                 
             return True
         except Exception as e:
@@ -101,8 +189,8 @@ class VSCodeClientAdapter(MCPClientAdapter):
         
         try:
             try:
-                with open(config_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                with open(config_path, "rb") as f:
+                    return loads(f.read())
             except (FileNotFoundError, json.JSONDecodeError):
                 return {}
         except Exception as e:
@@ -131,34 +219,9 @@ class VSCodeClientAdapter(MCPClientAdapter):
             server_name = server_url
             
         try:
-            # Use enhanced lookup with multiple strategies
-            server_info = self.registry_client.find_server_by_reference(server_url)
-            
-            # Fail if server is not found in registry - security requirement
-            if not server_info:
-                raise ValueError(f"Failed to retrieve server details for '{server_url}'. Server not found in registry.")
-            
-            # Format server configuration and get input variables if any
-            server_config, input_vars = self._format_server_config(server_info)
-            
+            server_info = self._lookup_server(server_url)
             config = self.get_current_config()
-            
-            # Make sure we have the servers object
-            if "servers" not in config:
-                config["servers"] = {}
-                
-            # Add input variables if any
-            if input_vars:
-                if "inputs" not in config:
-                    config["inputs"] = []
-                # Merge with existing inputs, avoiding duplicates by id
-                existing_input_ids = [input_var.get("id") for input_var in config.get("inputs", [])]
-                for input_var in input_vars:
-                    if input_var.get("id") not in existing_input_ids:
-                        config["inputs"].append(input_var)
-                
-            # Add the server configuration
-            config["servers"][server_name] = server_config
+            self._add_server_to_config(config, server_info, server_name)
                 
             # Update the configuration
             return self.update_config(config)
@@ -170,6 +233,92 @@ class VSCodeClientAdapter(MCPClientAdapter):
             print(f"Error configuring MCP server: {e}")
             return False
     
+    def configure_mcp_servers(self, server_urls):
+        """Configure several MCP servers with a single configuration write.
+        
+        Each server is registered under its own reference, like
+        ``configure_mcp_server(server_url, server_name=server_url)``.
+        
+        Args:
+            server_urls (list): URLs or identifiers of the MCP servers.
+            
+        Returns:
+            list: References of the servers that were configured.
+        """
+        if not server_urls:
+            return []
+        
+        # Registry lookups are network-bound, so resolve them concurrently
+        servers_info = self.registry_client.find_servers_by_reference(server_urls)
+        
+        config = self.get_current_config()
+        configured = []
+        
+        for server_url in server_urls:
+            try:
+                server_info = servers_info.get(server_url)
+                if isinstance(server_info, Exception):
+                    raise server_info
+                if not server_info:
+                    raise ValueError(f"Failed to retrieve server details for '{server_url}'. Server not found in registry.")
+                self._add_server_to_config(config, server_info, server_url)
+                configured.append(server_url)
+            except Exception as e:
+                print(f"Error configuring MCP server {server_url}: {e}")
+        
+        if configured and not self.update_config(config):
+            return []
+        return configured
+    
+    def _lookup_server(self, server_url):
+        """Look up a server in the registry.
+        
+        Args:
+            server_url (str): URL or identifier of the MCP server.
+            
+        Returns:
+            dict: Server information from the registry.
+            
+        Raises:
+            ValueError: If the server is not found in the registry.
+        """
+        # Use enhanced lookup with multiple strategies
+        server_info = self.registry_client.find_server_by_reference(server_url)
+        
+        # Fail if server is not found in registry - security requirement
+        if not server_info:
+            raise ValueError(f"Failed to retrieve server details for '{server_url}'. Server not found in registry.")
+        
+        return server_info
+    
+    def _add_server_to_config(self, config, server_info, server_name):
+        """Add a registry server to an in-memory configuration.
+        
+        Args:
+            config (dict): Configuration to update in place.
+            server_info (dict): Server information from the registry.
+            server_name (str): Name to register the server under.
+        """
+        # Format server configuration and get input variables if any
+        server_config, input_vars = self._format_server_config(server_info)
+        
+        # Make sure we have the servers object
+        if "servers" not in config:
+            config["servers"] = {}
+            
+        # Add input variables if any
+        if input_vars:
+            if "inputs" not in config:
+                config["inputs"] = []
+            # Merge with existing inputs, avoiding duplicates by id
+            existing_input_ids = [input_var.get("id") for input_var in config.get("inputs", [])]
+            for input_var in input_vars:
+                if input_var.get("id") not in existing_input_ids:
+                    config["inputs"].append(input_var)
+            
+        # Add the server configuration
+        config["servers"][server_name] = server_config
+    
     def _format_server_config(self, server_info):
         """Format server details into VSCode mcp.json compatible format.
         
@@ -189,77 +338,11 @@ class VSCodeClientAdapter(MCPClientAdapter):
         if "packages" in server_info and server_info["packages"]:
             package = server_info["packages"][0]
             runtime_hint = package.get("runtime_hint", "")
-            
-            # Handle npm packages
-            if runtime_hint == "npx" or "npm" in package.get("registry_name", "").lower():
-                # Get args directly from runtime_arguments
-                args = []
-                if "runtime_arguments" in package and package["runtime_arguments"]:
-                    for arg in package["runtime_arguments"]:
-                        if arg.get("is_required", False) and arg.get("value_hint"):
-                            args.append(arg.get("value_hint"))
-                
-                # Fallback if no runtime_arguments are provided
-                if not args and package.get("name"):
-                    args = [package.get("name")]
-                
-                server_config = {
-                    "type": "stdio",
-                    "command": "npx",
-                    "args": args
-                }
-            
-            # Handle docker packages
-            elif runtime_hint == "docker":
-                # Get args directly from runtime_arguments
-                args = []
-                if "runtime_arguments" in package and package["runtime_arguments"]:
-                    for arg in package["runtime_arguments"]:
-                        if arg.get("is_required", False) and arg.get("value_hint"):
-                            args.append(arg.get("value_hint"))
-                
-                # Fallback if no runtime_arguments are provided - use standard docker run command
-                if not args:
-                    args = ["run", "-i", "--rm", package.get("name")]
-                
-                server_config = {
-                    "type": "stdio",
-                    "command": "docker",
-                    "args": args
-                }
-            
-            # Handle Python packages
-            elif runtime_hint in ["uvx", "pip", "python"] or "python" in runtime_hint or package.get("registry_name", "").lower() == "pypi":
-                # Determine the command based on runtime_hint
-                if runtime_hint == "uvx":
-                    command = "uvx"
-                elif "python" in runtime_hint:
-                    # Use the specified Python path if it's a full path, otherwise default to python3
-                    command = "python3" if runtime_hint in ["python", "pip"] else runtime_hint
-                else:
-                    command = "python3"
-                
-                # Get args directly from runtime_arguments
-                args = []
-                if "runtime_arguments" in package and package["runtime_arguments"]:
-                    for arg in package["runtime_arguments"]:
-                        if arg.get("is_required", False) and arg.get("value_hint"):
-                            args.append(arg.get("value_hint"))
-                
-                # Fallback if no runtime_arguments are provided
-                if not args:
-                    if runtime_hint == "uvx":
-                        module_name = package.get("name", "").replace("mcp-server-", "")
-                        args = [f"mcp-server-{module_name}"]
-                    else:
-                        module_name = package.get("name", "").replace("mcp-server-", "").replace("-", "_")
-                        args = ["-m", f"mcp_server_{module_name}"]
-                
-                server_config = {
-                    "type": "stdio",
-                    "command": command,
-                    "args": args
-                }
+            formatter = _PACKAGE_FORMATTERS.get(
+                _package_kind(runtime_hint, package.get("registry_name", "").lower())
+            )
+            if formatter is not None:
+                server_config = formatter(package, runtime_hint)
             
             # Add environment variables if present
             if "environment_variables" in package and package["environment_variables"]:
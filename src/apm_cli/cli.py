@@ -1,11 +1,5 @@
 """Command-line interface for Agent Primitives Manager (APM)."""
 
-import sys
-import os
-import click
-from pathlib import Path
-from colorama import init, Fore, Style
-
 # Standard imports
 import sys
 import os
@@ -588,7 +582,7 @@ def preview(ctx, script_name, param):
                 if compiled_prompt_files:
                     file_list = []
                     for prompt_file in compiled_prompt_files:
-                        output_name = Path(prompt_file).stem.replace('.prompt', '') + '.txt'
+                        output_name = script_runner.compiler.compiled_filename(prompt_file)
                         compiled_path = Path('.apm/compiled') / output_name
                         file_list.append(str(compiled_path))
                     
@@ -616,7 +610,7 @@ def preview(ctx, script_name, param):
                     
                     _rich_info("Compiled prompt files:")
                     for prompt_file in compiled_prompt_files:
-                        output_name = Path(prompt_file).stem.replace('.prompt', '') + '.txt'
+                        output_name = script_runner.compiler.compiled_filename(prompt_file)
                         compiled_path = Path('.apm/compiled') / output_name
                         click.echo(f"  - {compiled_path}")
                 else:
@@ -784,8 +778,7 @@ def _watch_mode(output, chatmode, no_links, dry_run):
                     return
                     
                 # Check if it's a relevant file
-                if (event.src_path.endswith('.md') or 
-                    event.src_path.endswith('apm.yml')):
+                if event.src_path.endswith(('.md', 'apm.yml')):
                     
                     # Debounce rapid changes
                     current_time = time.time()
@@ -5,6 +5,10 @@ from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 
 
+# Closing '---' line of a YAML frontmatter block (surrounding blanks allowed)
+_FRONTMATTER_END_RE = re.compile(r'^[^\S\n]*---[^\S\n]*$', re.MULTILINE)
+
+
 def resolve_markdown_links(content: str, base_path: Path) -> str:
     """Resolve markdown links and inline referenced content.
     
@@ -169,18 +173,9 @@ def _remove_frontmatter(content: str) -> str:
     """
     # Remove YAML frontmatter (--- at start, --- at end)
     if content.startswith('---\n'):
-        lines = content.split('\n')
-        in_frontmatter = True
-        content_lines = []
-        
-        for i, line in enumerate(lines[1:], 1):  # Skip first ---
-            if line.strip() == '---' and in_frontmatter:
-                in_frontmatter = False
-                continue
-            if not in_frontmatter:
-                content_lines.append(line)
-        
-        content = '\n'.join(content_lines)
+        # Find the closing delimiter in one search past the opening line
+        match = _FRONTMATTER_END_RE.search(content, 4)
+        content = content[match.end():] if match else ''
     
     return content.strip()
 
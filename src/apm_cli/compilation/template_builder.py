@@ -1,5 +1,6 @@
 """Template building system for AGENTS.md compilation."""
 
+import io
 import re
 from dataclasses import dataclass
 from pathlib import Path
@@ -31,16 +32,18 @@ def build_conditional_sections(instructions: List[Instruction]) -> str:
     # Group instructions by pattern - use raw patterns
     pattern_groups = _group_instructions_by_pattern(instructions)
     
-    sections = []
+    buf = io.StringIO()
     
     for pattern, pattern_instructions in pattern_groups.items():
-        sections.append(f"## Files matching `{pattern}`")
-        sections.append("")
+        buf.write(f"## Files matching `{pattern}`\n\n")
         
-        # Combine content from all instructions for this pattern
+        # Combine content from all instructions for this pattern, skipping
+        # instructions whose content was already emitted for the same pattern
+        seen_content = set()
         for instruction in pattern_instructions:
             content = instruction.content.strip()
-            if content:
+            if content and content not in seen_content:
+                seen_content.add(content)
                 # Add source file comment before the content
                 try:
                     # Try to get relative path for cleaner display
@@ -52,12 +55,12 @@ def build_conditional_sections(instructions: List[Instruction]) -> str:
                     # Fall back to absolute or given path if relative fails
                     relative_path = instruction.file_path
                 
-                sections.append(f"<!-- Source: {relative_path} -->")
-                sections.append(content)
-                sections.append(f"<!-- End source: {relative_path} -->")
-                sections.append("")
+                buf.write(f"<!-- Source: {relative_path} -->\n")
+                buf.write(content)
+                buf.write(f"\n<!-- End source: {relative_path} -->\n\n")
     
-    return "\n".join(sections)
+    # Every section ends with a blank line; drop the final line break after it
+    return buf.getvalue()[:-1]
 
 
 def find_chatmode_by_name(chatmodes: List[Chatmode], chatmode_name: str) -> Optional[Chatmode]:
@@ -110,28 +113,27 @@ def generate_agents_md_template(template_data: TemplateData) -> str:
     Returns:
         str: Complete AGENTS.md file content.
     """
-    sections = []
+    buf = io.StringIO()
     
     # Header
-    sections.append("# AGENTS.md")
-    sections.append(f"<!-- Generated by APM CLI from .apm/ primitives -->")
-    sections.append(f"<!-- Generated on: {template_data.timestamp} -->")
-    sections.append(f"<!-- APM Version: {template_data.version} -->")
-    sections.append("")
+    buf.write("# AGENTS.md\n")
+    buf.write("<!-- Generated by APM CLI from .apm/ primitives -->\n")
+    buf.write(f"<!-- Generated on: {template_data.timestamp} -->\n")
+    buf.write(f"<!-- APM Version: {template_data.version} -->\n\n")
     
     # Chatmode content (if provided)
     if template_data.chatmode_content:
-        sections.append(template_data.chatmode_content.strip())
-        sections.append("")
+        buf.write(template_data.chatmode_content.strip())
+        buf.write("\n\n")
     
     # Instructions content (grouped by patterns)
     if template_data.instructions_content:
-        sections.append(template_data.instructions_content)
+        buf.write(template_data.instructions_content)
+        buf.write("\n")
     
     # Footer
-    sections.append("---")
-    sections.append("*This file was generated by APM CLI. Do not edit manually.*")
-    sections.append("*To regenerate: `apm compile`*")
-    sections.append("")
+    buf.write("---\n")
+    buf.write("*This file was generated by APM CLI. Do not edit manually.*\n")
+    buf.write("*To regenerate: `apm compile`*\n")
     
-    return "\n".join(sections)
\ No newline at end of file
+    return buf.getvalue()
@@ -2,6 +2,7 @@
 
 import os
 import json
+from .utils.json_io import dumps
 
 
 CONFIG_DIR = os.path.expanduser("~/.apm-cli")
@@ -25,7 +26,7 @@ def get_config():
         dict: Current configuration.
     """
     ensure_config_exists()
-    with open(CONFIG_FILE, "r") as f:
+    with open(CONFIG_FILE, "r", encoding="utf-8") as f:
         return json.load(f)
 
 
@@ -38,8 +39,8 @@ def update_config(updates):
     config = get_config()
     config.update(updates)
     
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(config, f, indent=2)
+    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
+        f.write(dumps(config))
 
 
 def get_default_client():
@@ -48,6 +48,24 @@ def install_package(client_type, package_name, version=None):
         return False
 
 
+def install_packages(client_type, package_names):
+    """Install several MCP packages with a single client configuration write.
+    
+    Args:
+        client_type (str): Type of client to configure.
+        package_names (list): Names of the packages to install.
+    
+    Returns:
+        list: Names of the packages that were installed.
+    """
+    try:
+        client = ClientFactory.create_client(client_type)
+        return client.configure_mcp_servers(package_names)
+    except Exception as e:
+        print(f"Error installing packages: {e}")
+        return []
+
+
 def uninstall_package(client_type, package_name):
     """Uninstall an MCP package.
     
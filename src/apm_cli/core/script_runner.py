@@ -111,9 +111,15 @@ class ScriptRunner:
         Returns:
             Transformed command for proper runtime execution
         """
+        # Capture the arguments around the prompt file once per runtime, so each
+        # branch below runs a single regex search instead of a probe plus a match
+        file_pattern = re.escape(prompt_file)
+        codex_pattern = re.compile(r'codex\s+(.*?)' + file_pattern + r'(.*?)$')
+        llm_pattern = re.compile(r'llm\s+(.*?)' + file_pattern + r'(.*?)$')
+        
         # Handle environment variables prefix (e.g., "ENV1=val1 ENV2=val2 codex [args] file.prompt.md")
         # More robust approach: split by ' codex ' to separate env vars from command
-        if ' codex ' in command and re.search(re.escape(prompt_file), command):
+        if ' codex ' in command and prompt_file in command:
             parts = command.split(' codex ', 1)
             potential_env_part = parts[0]
             codex_part = 'codex ' + parts[1]
@@ -123,10 +129,10 @@ class ScriptRunner:
                 env_vars = potential_env_part
                 
                 # Extract arguments before and after the prompt file from codex part
-                codex_match = re.search(r'codex\s+(.*?)(' + re.escape(prompt_file) + r')(.*?)$', codex_part)
+                codex_match = codex_pattern.search(codex_part)
                 if codex_match:
                     args_before_file = codex_match.group(1).strip()
-                    args_after_file = codex_match.group(3).strip()
+                    args_after_file = codex_match.group(2).strip()
                     
                     # Build the exec command
                     if args_before_file:
@@ -138,13 +144,12 @@ class ScriptRunner:
                         result += f" {args_after_file}"
                     return result
         
-        # Handle "codex [args] file.prompt.md [more_args]" -> "codex exec [args] 'compiled_content' [more_args]"  
-        elif re.search(r'codex\s+.*' + re.escape(prompt_file), command):
-            # Extract arguments before and after the prompt file
-            match = re.search(r'codex\s+(.*?)(' + re.escape(prompt_file) + r')(.*?)$', command)
+        else:
+            # Handle "codex [args] file.prompt.md [more_args]" -> "codex exec [args] 'compiled_content' [more_args]"  
+            match = codex_pattern.search(command)
             if match:
                 args_before_file = match.group(1).strip()
-                args_after_file = match.group(3).strip()
+                args_after_file = match.group(2).strip()
                 
                 # Build the exec command with arguments
                 if args_before_file:
@@ -155,14 +160,12 @@ class ScriptRunner:
                 if args_after_file:
                     result += f" {args_after_file}"
                 return result
-        
-        # Handle "llm file.prompt.md [options]" -> "llm 'compiled_content' [options]"
-        elif re.search(r'llm\s+.*' + re.escape(prompt_file), command):
-            # Extract any additional options after the file
-            match = re.search(r'llm\s+(.*?)(' + re.escape(prompt_file) + r')(.*?)$', command)
+            
+            # Handle "llm file.prompt.md [options]" -> "llm 'compiled_content' [options]"
+            match = llm_pattern.search(command)
             if match:
                 args_before_file = match.group(1).strip()
-                args_after_file = match.group(3).strip()
+                args_after_file = match.group(2).strip()
                 
                 # For llm, we don't add exec, just replace the file with content
                 result = f"llm"
@@ -172,10 +175,10 @@ class ScriptRunner:
                 if args_after_file:
                     result += f" {args_after_file}"
                 return result
-        
-        # Handle bare "file.prompt.md" -> "codex exec 'compiled_content'" (default to codex)
-        elif command.strip() == prompt_file:
-            return f"codex exec '{compiled_content}'"
+            
+            # Handle bare "file.prompt.md" -> "codex exec 'compiled_content'" (default to codex)
+            if command.strip() == prompt_file:
+                return f"codex exec '{compiled_content}'"
         
         # Fallback: just replace file path with compiled path
         # This handles any other patterns we might have missed
@@ -226,8 +229,7 @@ class PromptCompiler:
         compiled_content = self._substitute_parameters(main_content, params)
         
         # Generate output file path
-        output_name = prompt_path.stem.replace('.prompt', '') + '.txt'
-        output_path = self.compiled_dir / output_name
+        output_path = self.compiled_dir / self.compiled_filename(prompt_file)
         
         # Write compiled content
         with open(output_path, 'w') as f:
@@ -235,6 +237,21 @@ class PromptCompiler:
         
         return str(output_path)
     
+    @staticmethod
+    def compiled_filename(prompt_file: str) -> str:
+        """Get the name of the compiled output file for a prompt file.
+        
+        Args:
+            prompt_file: Path to the .prompt.md file
+            
+        Returns:
+            File name with the trailing '.prompt' stem suffix replaced by '.txt'
+        """
+        name = Path(prompt_file).stem
+        if name.endswith('.prompt'):
+            name = name[:-len('.prompt')]
+        return name + '.txt'
+    
     def _substitute_parameters(self, content: str, params: Dict[str, str]) -> str:
         """Substitute parameters in content.
         
@@ -245,6 +262,10 @@ class PromptCompiler:
         Returns:
             Content with parameters substituted
         """
+        # Prompts without placeholders need no replace passes at all
+        if not params or "${input:" not in content:
+            return content
+        
         result = content
         for key, value in params.items():
             # Replace ${input:key} placeholders
@@ -3,8 +3,6 @@
 import os
 import glob
 from pathlib import Path
-import yaml
-import frontmatter
 
 
 def scan_workflows_for_dependencies():
@@ -27,6 +25,10 @@ def scan_workflows_for_dependencies():
     workflows = list(set(workflows))
     
     all_servers = set()
+    if not workflows:
+        return all_servers
+    
+    import frontmatter
     
     for workflow_file in workflows:
         try:
@@ -58,6 +60,8 @@ def sync_workflow_dependencies(output_file="apm.yml"):
     }
     
     try:
+        import yaml
+        
         # Create the file
         with open(output_file, 'w', encoding='utf-8') as f:
             yaml.dump(apm_config, f, default_flow_style=False)
@@ -1,14 +1,24 @@
 """Dependency verification for APM-CLI."""
 
 import os
-from pathlib import Path
 import yaml
-from ..factory import PackageManagerFactory, ClientFactory
+from ..factory import PackageManagerFactory
+from ..core.operations import install_packages
+
+
+# Parsed configurations keyed by path, invalidated when the file's stat changes
+_CONFIG_CACHE = {}
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 def load_apm_config(config_file="apm.yml"):
     """Load the APM configuration file.
     
+    The parsed configuration is cached until the file's mtime or size changes,
+    so callers must treat the returned dict as read-only.
+    
     Args:
         config_file (str, optional): Path to the configuration file. Defaults to "apm.yml".
         
@@ -16,14 +26,27 @@ def load_apm_config(config_file="apm.yml"):
         dict: The configuration, or None if loading failed.
     """
     try:
-        config_path = Path(config_file)
-        if not config_path.exists():
-            print(f"Configuration file {config_file} not found.")
-            return None
+        f = open(config_file, 'r', encoding='utf-8')
+    except FileNotFoundError:
+        print(f"Configuration file {config_file} not found.")
+        return None
+    except Exception as e:
+        print(f"Error loading {config_file}: {e}")
+        return None
+    
+    try:
+        with f:
+            # Stat the open descriptor so the cache check sees the file we read
+            stat = os.fstat(f.fileno())
+            signature = (stat.st_mtime_ns, stat.st_size)
+            cache_key = os.path.abspath(config_file)
+            cached = _CONFIG_CACHE.get(cache_key)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
             
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_YAML_LOADER)
         
+        _CONFIG_CACHE[cache_key] = (signature, config)
         return config
     except Exception as e:
         print(f"Error loading {config_file}: {e}")
@@ -45,12 +68,16 @@ def verify_dependencies(config_file="apm.yml"):
     
     try:
         package_manager = PackageManagerFactory.create_package_manager()
-        installed = package_manager.list_installed()
+        installed = set(package_manager.list_installed())
         
-        # Check which servers are missing
-        required_servers = config['servers']
-        missing = [server for server in required_servers if server not in installed]
-        installed_servers = [server for server in required_servers if server in installed]
+        # Split required servers into installed and missing in a single pass
+        missing = []
+        installed_servers = []
+        for server in config['servers']:
+            if server in installed:
+                installed_servers.append(server)
+            else:
+                missing.append(server)
         
         all_installed = len(missing) == 0
         
@@ -75,28 +102,7 @@ def install_missing_dependencies(config_file="apm.yml", client_type="vscode"):
     if not missing:
         return True, []
     
-    installed = []
-    
-    # Get client adapter and package manager
-    client = ClientFactory.create_client(client_type)
-    package_manager = PackageManagerFactory.create_package_manager()
-    
-    for server in missing:
-        try:
-            # Install the package using the package manager
-            install_result = package_manager.install(server)
-            
-            if install_result:
-                # Configure the client to use the server
-                # For VSCode this updates the .vscode/mcp.json file in the project root
-                client_result = client.configure_mcp_server(server, server_name=server)
-                
-                if client_result:
-                    installed.append(server)
-                else:
-                    print(f"Warning: Package {server} installed but client configuration failed")
-            
-        except Exception as e:
-            print(f"Error installing {server}: {e}")
+    # Configure all missing servers with a single client config write
+    installed = install_packages(client_type, missing)
     
-    return len(installed) == len(missing), installed
\ No newline at end of file
+    return len(installed) == len(missing), installed
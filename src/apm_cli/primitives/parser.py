@@ -3,7 +3,6 @@
 import os
 from pathlib import Path
 from typing import Union, List
-import frontmatter
 
 from .models import Chatmode, Instruction, Context, Primitive
 
@@ -22,6 +21,9 @@ def parse_primitive_file(file_path: Union[str, Path]) -> Primitive:
     Raises:
         ValueError: If file cannot be parsed or has invalid format.
     """
+    # Imported here so that PyYAML is only loaded when primitives are parsed
+    import frontmatter
+    
     file_path = Path(file_path)
     
     try:
@@ -38,7 +40,7 @@ def parse_primitive_file(file_path: Union[str, Path]) -> Primitive:
             return _parse_chatmode(name, file_path, metadata, content)
         elif file_path.name.endswith('.instructions.md'):
             return _parse_instruction(name, file_path, metadata, content)
-        elif file_path.name.endswith('.context.md') or file_path.name.endswith('.memory.md') or _is_context_file(file_path):
+        elif file_path.name.endswith(('.context.md', '.memory.md')) or _is_context_file(file_path):
             return _parse_context(name, file_path, metadata, content)
         else:
             raise ValueError(f"Unknown primitive file type: {file_path}")
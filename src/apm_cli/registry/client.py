@@ -1,13 +1,21 @@
 """Simple MCP Registry client for server discovery."""
 
 import os
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional, Any, Tuple
+from ..utils.json_io import loads
 
 
 class SimpleRegistryClient:
     """Simple client for querying MCP registries for server discovery."""
 
+    # HTTP sessions shared by every client of the same registry, so that
+    # repeated client instances reuse pooled keep-alive connections
+    _sessions: Dict[str, requests.Session] = {}
+
     def __init__(self, registry_url: Optional[str] = None):
         """Initialize the registry client.
 
@@ -19,7 +27,91 @@ class SimpleRegistryClient:
         self.registry_url = registry_url or os.environ.get(
             "MCP_REGISTRY_URL", "https://demo.registry.azure-mcp.net"
         )
-        self.session = requests.Session()
+        self.session = self._get_session(self.registry_url)
+        # Lazily built indexes over the first server listing, see refresh()
+        self._index_lock = threading.Lock()
+        self._servers: Optional[List[Dict[str, Any]]] = None
+        # (name_lower, description_lower, server) tuples for search
+        self._search_index: Optional[List[Tuple[str, str, Dict[str, Any]]]] = None
+        # Server IDs by exact server name, in listing order
+        self._name_index: Optional[Dict[str, List[str]]] = None
+
+    def refresh(self) -> None:
+        """Drop the cached server listing so the next lookups refetch it."""
+        with self._index_lock:
+            self._servers = None
+            self._search_index = None
+            self._name_index = None
+
+    def _get_servers(self) -> List[Dict[str, Any]]:
+        """Get the server listing, fetching it on first use.
+
+        Returns:
+            List[Dict[str, Any]]: Server metadata dictionaries.
+
+        Raises:
+            requests.RequestException: If the request fails.
+        """
+        with self._index_lock:
+            if self._servers is None:
+                self._servers, _ = self.list_servers()
+            return self._servers
+
+    def _get_server_ids(self, name: str) -> List[str]:
+        """Get the IDs of the servers with an exact name.
+
+        Args:
+            name (str): Server name.
+
+        Returns:
+            List[str]: Matching server IDs, in listing order.
+
+        Raises:
+            requests.RequestException: If the request fails.
+        """
+        if self._name_index is None:
+            name_index: Dict[str, List[str]] = {}
+            for server in self._get_servers():
+                if "id" in server:
+                    name_index.setdefault(server.get("name"), []).append(server["id"])
+            self._name_index = name_index
+        return self._name_index.get(name, [])
+
+    @classmethod
+    def _get_session(cls, registry_url: str) -> requests.Session:
+        """Get the shared HTTP session for a registry, creating it on first use.
+
+        Args:
+            registry_url (str): URL of the MCP registry.
+
+        Returns:
+            requests.Session: Session with a pooled HTTP adapter.
+        """
+        session = cls._sessions.get(registry_url)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session = cls._sessions.setdefault(registry_url, session)
+        return session
+
+    def _get_json(self, path: str, **kwargs: Any) -> Any:
+        """Issue a GET request against the registry and decode the JSON body.
+
+        Args:
+            path (str): Path relative to the registry URL.
+            **kwargs: Extra arguments passed to ``requests.Session.get``.
+
+        Returns:
+            Any: Decoded JSON payload.
+
+        Raises:
+            requests.RequestException: If the request fails.
+        """
+        response = self.session.get(f"{self.registry_url}{path}", **kwargs)
+        response.raise_for_status()
+        return loads(response.content)
 
     def list_servers(self, limit: int = 100, cursor: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
         """List all available servers in the registry.
@@ -34,7 +126,6 @@ class SimpleRegistryClient:
         Raises:
             requests.RequestException: If the request fails.
         """
-        url = f"{self.registry_url}/v0/servers"
         params = {}
         
         if limit is not None:
@@ -42,9 +133,7 @@ class SimpleRegistryClient:
         if cursor is not None:
             params['cursor'] = cursor
             
-        response = self.session.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
+        data = self._get_json("/v0/servers", params=params)
         
         servers = data.get("servers", [])
         metadata = data.get("metadata", {})
@@ -64,13 +153,17 @@ class SimpleRegistryClient:
         Raises:
             requests.RequestException: If the request fails.
         """
-        servers, _ = self.list_servers()
+        if self._search_index is None:
+            self._search_index = [
+                ((server.get("name") or "").lower(), (server.get("description") or "").lower(), server)
+                for server in self._get_servers()
+            ]
         
         # Simple client-side filtering by name or description
+        query = query.lower()
         return [
-            server for server in servers 
-            if query.lower() in server.get("name", "").lower() 
-            or query.lower() in server.get("description", "").lower()
+            server for name, description, server in self._search_index
+            if query in name or query in description
         ]
 
     def get_server_info(self, server_id: str) -> Dict[str, Any]:
@@ -86,10 +179,7 @@ class SimpleRegistryClient:
             requests.RequestException: If the request fails.
             ValueError: If the server is not found.
         """
-        url = f"{self.registry_url}/v0/servers/{server_id}"
-        response = self.session.get(url)
-        response.raise_for_status()
-        server_info = response.json()
+        server_info = self._get_json(f"/v0/servers/{server_id}")
         
         if not server_info:
             raise ValueError(f"Server '{server_id}' not found in registry")
@@ -108,11 +198,9 @@ class SimpleRegistryClient:
         Raises:
             requests.RequestException: If the request fails.
         """
-        servers, _ = self.list_servers()
-        
-        for server in servers:
-            if server.get("name") == name:
-                return self.get_server_info(server["id"])
+        server_ids = self._get_server_ids(name)
+        if server_ids:
+            return self.get_server_info(server_ids[0])
                 
         return None
     
@@ -143,14 +231,38 @@ class SimpleRegistryClient:
             pass
         
         # Strategy 2: Exact name match
-        servers, _ = self.list_servers()
-        
-        for server in servers:
-            if server.get("name") == reference:
-                try:
-                    return self.get_server_info(server["id"])
-                except Exception:
-                    continue
+        for server_id in self._get_server_ids(reference):
+            try:
+                return self.get_server_info(server_id)
+            except Exception:
+                continue
                     
         # If not found by ID or exact name, server is not in registry
-        return None
\ No newline at end of file
+        return None
+
+    def find_servers_by_reference(self, references: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Resolve several server references concurrently.
+
+        Lookups run in a small thread pool over the shared, pooled session,
+        so their round trips overlap instead of running back to back.
+
+        Args:
+            references (List[str]): Server references (IDs or exact names).
+
+        Returns:
+            Dict[str, Any]: Per reference, the server metadata dictionary, None
+                when the reference is not found, or the exception its lookup
+                raised (for example a requests.RequestException), so callers
+                can tell a registry failure from a missing server.
+        """
+        if not references:
+            return {}
+
+        def lookup(reference: str) -> Any:
+            try:
+                return self.find_server_by_reference(reference)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=min(8, len(references))) as executor:
+            return dict(zip(references, executor.map(lookup, references)))
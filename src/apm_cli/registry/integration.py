@@ -17,6 +17,13 @@ class RegistryIntegration:
                 or falls back to the default demo registry.
         """
         self.client = SimpleRegistryClient(registry_url)
+        # Package details already fetched from the registry, keyed by ID or name
+        self._package_info_cache: Dict[str, Dict[str, Any]] = {}
+
+    def invalidate_cache(self) -> None:
+        """Drop cached package details and server listing so the next lookups hit the registry."""
+        self._package_info_cache.clear()
+        self.client.refresh()
 
     def list_available_packages(self) -> List[Dict[str, Any]]:
         """List all available packages in the registry.
@@ -44,12 +51,32 @@ class RegistryIntegration:
     def get_package_info(self, name: str) -> Dict[str, Any]:
         """Get detailed information about a specific package.
 
+        Results are cached per instance; call ``invalidate_cache`` to refetch.
+
         Args:
             name (str): Name of the package.
 
         Returns:
             Dict[str, Any]: Package metadata dictionary.
             
+        Raises:
+            ValueError: If the package is not found.
+        """
+        package_info = self._package_info_cache.get(name)
+        if package_info is None:
+            package_info = self._fetch_package_info(name)
+            self._package_info_cache[name] = package_info
+        return package_info
+
+    def _fetch_package_info(self, name: str) -> Dict[str, Any]:
+        """Fetch package details from the registry by ID, then by name.
+
+        Args:
+            name (str): ID or name of the package.
+
+        Returns:
+            Dict[str, Any]: Package metadata dictionary.
+            
         Raises:
             ValueError: If the package is not found.
         """
@@ -2,6 +2,7 @@
 
 import subprocess
 import shutil
+import threading
 from typing import Dict, Any, Optional
 from .base import RuntimeAdapter
 
@@ -9,6 +10,23 @@ from .base import RuntimeAdapter
 class CodexRuntime(RuntimeAdapter):
     """APM adapter for the Codex CLI."""
     
+    # The `codex --version` probe is done at most once per process. The PATH
+    # lookup is not cached, so a Codex installed mid-process is still found
+    _version_cache: Optional[str] = None
+    
+    # Constant part of get_runtime_info(); callers receive copies
+    _BASE_INFO: Dict[str, Any] = {
+        "name": "codex",
+        "type": "codex_cli",
+        "capabilities": {
+            "model_execution": True,
+            "mcp_servers": "native_support",
+            "configuration": "config.toml",
+            "sandboxing": "built_in"
+        },
+        "description": "OpenAI Codex CLI runtime adapter"
+    }
+    
     def __init__(self, model_name: Optional[str] = None):
         """Initialize Codex runtime.
         
@@ -30,8 +48,11 @@ class CodexRuntime(RuntimeAdapter):
         Returns:
             str: The response text from Codex
         """
-        import sys
-        import os
+        timed_out = threading.Event()
+        
+        def kill_on_timeout():
+            timed_out.set()
+            process.kill()
         
         try:
             # Use codex exec to execute the prompt with real-time streaming
@@ -47,14 +68,25 @@ class CodexRuntime(RuntimeAdapter):
             
             output_lines = []
             
-            # Stream output in real-time
-            for line in iter(process.stdout.readline, ''):
-                # Print to terminal in real-time
-                print(line, end='', flush=True)
-                output_lines.append(line)
+            # The 5 minute timeout covers streaming as well as exit: a watchdog
+            # kills the process on expiry, so the final wait can block without polling
+            watchdog = threading.Timer(300, kill_on_timeout)
+            watchdog.daemon = True
+            watchdog.start()
+            try:
+                # Stream output in real-time
+                for line in iter(process.stdout.readline, ''):
+                    # Print to terminal in real-time
+                    print(line, end='', flush=True)
+                    output_lines.append(line)
+                
+                # Wait for process to complete
+                return_code = process.wait()
+            finally:
+                watchdog.cancel()
             
-            # Wait for process to complete
-            return_code = process.wait(timeout=300)  # 5 minute timeout
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(process.args, 300)
             
             if return_code != 0:
                 full_output = ''.join(output_lines)
@@ -67,8 +99,6 @@ class CodexRuntime(RuntimeAdapter):
             return ''.join(output_lines).strip()
             
         except subprocess.TimeoutExpired:
-            if 'process' in locals():
-                process.kill()
             raise RuntimeError("Codex execution timed out after 5 minutes")
         except FileNotFoundError:
             raise RuntimeError("Codex CLI not found. Install with: npm i -g @openai/codex@native")
@@ -102,27 +132,25 @@ class CodexRuntime(RuntimeAdapter):
             Dict[str, Any]: Runtime information including name, version, capabilities
         """
         try:
-            # Try to get Codex version
-            version_result = subprocess.run(
-                ["codex", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            version = version_result.stdout.strip() if version_result.returncode == 0 else "unknown"
+            version = CodexRuntime._version_cache
+            if version is None:
+                # Try to get Codex version
+                version_result = subprocess.run(
+                    ["codex", "--version"],
+                    capture_output=True,
+                    text=True,
+                    timeout=10
+                )
+                
+                if version_result.returncode == 0:
+                    version = CodexRuntime._version_cache = version_result.stdout.strip()
+                else:
+                    version = "unknown"
             
             return {
-                "name": "codex",
-                "type": "codex_cli", 
+                **self._BASE_INFO,
                 "version": version,
-                "capabilities": {
-                    "model_execution": True,
-                    "mcp_servers": "native_support",
-                    "configuration": "config.toml",
-                    "sandboxing": "built_in"
-                },
-                "description": "OpenAI Codex CLI runtime adapter"
+                "capabilities": dict(self._BASE_INFO["capabilities"]),
             }
         except Exception as e:
             return {"error": f"Failed to get Codex runtime info: {e}"}
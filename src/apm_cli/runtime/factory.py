@@ -56,17 +56,32 @@ class RuntimeFactory:
         Raises:
             ValueError: If runtime not found or not available
         """
+        adapter_class = cls._get_adapter_class(runtime_name)
+        if adapter_class is None:
+            raise ValueError(f"Unknown runtime: {runtime_name}")
+        
+        if not adapter_class.is_available():
+            raise ValueError(f"Runtime '{runtime_name}' is not available on this system")
+        
+        if model_name:
+            return adapter_class(model_name)
+        else:
+            return adapter_class()
+    
+    @classmethod
+    def _get_adapter_class(cls, runtime_name: str) -> Optional[Type[RuntimeAdapter]]:
+        """Get the adapter class registered for a runtime name.
+        
+        Args:
+            runtime_name: Name of the runtime ('llm', 'codex')
+            
+        Returns:
+            Optional[Type[RuntimeAdapter]]: Adapter class, or None if the name is unknown
+        """
         for adapter_class in cls._RUNTIME_ADAPTERS:
             if adapter_class.get_runtime_name() == runtime_name:
-                if not adapter_class.is_available():
-                    raise ValueError(f"Runtime '{runtime_name}' is not available on this system")
-                
-                if model_name:
-                    return adapter_class(model_name)
-                else:
-                    return adapter_class()
-        
-        raise ValueError(f"Unknown runtime: {runtime_name}")
+                return adapter_class
+        return None
     
     @classmethod
     def get_best_available_runtime(cls, model_name: Optional[str] = None) -> RuntimeAdapter:
@@ -123,8 +138,7 @@ class RuntimeFactory:
         Returns:
             bool: True if runtime exists and is available
         """
-        try:
-            cls.get_runtime_by_name(runtime_name)
-            return True
-        except ValueError:
-            return False
\ No newline at end of file
+        # Only the availability probe is needed; creating the runtime here
+        # would launch it a second time when the caller goes on to create it
+        adapter_class = cls._get_adapter_class(runtime_name)
+        return adapter_class is not None and adapter_class.is_available()
\ No newline at end of file
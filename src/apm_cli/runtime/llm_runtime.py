@@ -1,15 +1,32 @@
 """LLM runtime adapter for APM."""
 
 import subprocess
+import shutil
 import tempfile
 import os
 from typing import Dict, Any, Optional
 from .base import RuntimeAdapter
 
+# Models reported by `llm models list`, cached after the first successful call
+_models_cache: Optional[Dict[str, Any]] = None
+
 
 class LLMRuntime(RuntimeAdapter):
     """APM adapter for the llm CLI."""
     
+    # Constant part of get_runtime_info(); callers receive copies
+    _BASE_INFO: Dict[str, Any] = {
+        "name": "llm",
+        "type": "llm_library",
+        "capabilities": {
+            "model_execution": True,
+            "mcp_servers": "runtime_dependent",
+            "configuration": "llm_commands",
+            "sandboxing": "runtime_dependent"
+        },
+        "description": "LLM CLI runtime adapter"
+    }
+    
     def __init__(self, model_name: Optional[str] = None):
         """Initialize LLM runtime with specified model.
         
@@ -18,10 +35,10 @@ class LLMRuntime(RuntimeAdapter):
         """
         self.model_name = model_name
         
-        # Verify llm CLI is available
+        # Verify llm CLI is available; its output is not needed
         try:
-            result = subprocess.run(['llm', '--version'], 
-                                  capture_output=True, text=True, check=True)
+            subprocess.run(['llm', '--version'], 
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
         except (subprocess.CalledProcessError, FileNotFoundError):
             raise RuntimeError("llm CLI not found. Please install: pip install llm")
     
@@ -85,6 +102,10 @@ class LLMRuntime(RuntimeAdapter):
         Returns:
             Dict[str, Any]: Dictionary of available models and their info
         """
+        global _models_cache
+        if _models_cache is not None:
+            return dict(_models_cache)
+        
         try:
             result = subprocess.run(['llm', 'models', 'list'], 
                                   capture_output=True, text=True, check=True)
@@ -97,7 +118,8 @@ class LLMRuntime(RuntimeAdapter):
                         "id": model_id,
                         "provider": "llm"
                     }
-            return models
+            _models_cache = models
+            return dict(models)
         except Exception as e:
             return {"error": f"Failed to list models: {e}"}
     
@@ -114,16 +136,9 @@ class LLMRuntime(RuntimeAdapter):
         """
         try:
             return {
-                "name": "llm",
-                "type": "llm_library",
+                **self._BASE_INFO,
                 "current_model": self.model_name or "default",
-                "capabilities": {
-                    "model_execution": True,
-                    "mcp_servers": "runtime_dependent",
-                    "configuration": "llm_commands",
-                    "sandboxing": "runtime_dependent"
-                },
-                "description": "LLM CLI runtime adapter"
+                "capabilities": dict(self._BASE_INFO["capabilities"]),
             }
         except Exception as e:
             return {"error": f"Failed to get runtime info: {e}"}
@@ -135,12 +150,7 @@ class LLMRuntime(RuntimeAdapter):
         Returns:
             bool: True if runtime is available, False otherwise
         """
-        try:
-            subprocess.run(['llm', '--version'], 
-                          capture_output=True, text=True, check=True)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        return shutil.which("llm") is not None
     
     @staticmethod
     def get_runtime_name() -> str:
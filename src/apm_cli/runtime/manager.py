@@ -154,7 +154,8 @@ class RuntimeManager:
                 try:
                     result = subprocess.run(
                         [str(binary_path), "--version"],
-                        capture_output=True,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
                         text=True,
                         timeout=5
                     )
@@ -1,45 +1,53 @@
 """Helper utility functions for APM-CLI."""
 
-import os
+import functools
 import platform
-import subprocess
 import shutil
-import sys
+
+
+# Package managers probed by get_available_package_managers, in reporting order
+_PACKAGE_MANAGERS = (
+    # Python package managers
+    "uv",
+    "pip",
+    "pipx",
+    # JavaScript package managers
+    "npm",
+    "yarn",
+    "pnpm",
+    # System package managers
+    "brew",    # macOS
+    "apt",     # Debian/Ubuntu
+    "yum",     # CentOS/RHEL
+    "dnf",     # Fedora
+    "apk",     # Alpine
+    "pacman",  # Arch
+)
+
+
+# Tools found by is_tool_available; misses are not cached, see its docstring
+_available_tools = set()
 
 
 def is_tool_available(tool_name):
     """Check if a command-line tool is available.
     
+    The PATH lookup is done in-process with shutil.which. Tools that are
+    found are cached for the lifetime of the process; a missing tool is
+    looked up again on every call, so one installed later is still found.
+    
     Args:
         tool_name (str): Name of the tool to check.
     
     Returns:
         bool: True if the tool is available, False otherwise.
     """
-    # First try using shutil.which which is more reliable across platforms
-    if shutil.which(tool_name):
+    if tool_name in _available_tools:
         return True
-        
-    # Fall back to subprocess approach if shutil.which returns None
-    try:
-        # Different approaches for different platforms
-        if sys.platform == 'win32':
-            # On Windows, use 'where' command but WITHOUT shell=True
-            result = subprocess.run(['where', tool_name], 
-                                   stdout=subprocess.PIPE, 
-                                   stderr=subprocess.PIPE,
-                                   shell=False,  # Changed from True to False
-                                   check=False)
-            return result.returncode == 0
-        else:
-            # On Unix-like systems, use 'which' command
-            result = subprocess.run(['which', tool_name], 
-                                   stdout=subprocess.PIPE, 
-                                   stderr=subprocess.PIPE,
-                                   check=False)
-            return result.returncode == 0
-    except Exception:
+    if shutil.which(tool_name) is None:
         return False
+    _available_tools.add(tool_name)
+    return True
 
 
 def get_available_package_managers():
@@ -48,41 +56,14 @@ def get_available_package_managers():
     Returns:
         dict: Dictionary of available package managers and their paths.
     """
-    package_managers = {}
-    
-    # Check for Python package managers
-    if is_tool_available("uv"):
-        package_managers["uv"] = "uv"
-    if is_tool_available("pip"):
-        package_managers["pip"] = "pip"
-    if is_tool_available("pipx"):
-        package_managers["pipx"] = "pipx"
-    
-    # Check for JavaScript package managers
-    if is_tool_available("npm"):
-        package_managers["npm"] = "npm"
-    if is_tool_available("yarn"):
-        package_managers["yarn"] = "yarn"
-    if is_tool_available("pnpm"):
-        package_managers["pnpm"] = "pnpm"
-    
-    # Check for system package managers
-    if is_tool_available("brew"):  # macOS
-        package_managers["brew"] = "brew"
-    if is_tool_available("apt"):   # Debian/Ubuntu
-        package_managers["apt"] = "apt"
-    if is_tool_available("yum"):   # CentOS/RHEL
-        package_managers["yum"] = "yum"
-    if is_tool_available("dnf"):   # Fedora
-        package_managers["dnf"] = "dnf"
-    if is_tool_available("apk"):   # Alpine
-        package_managers["apk"] = "apk"
-    if is_tool_available("pacman"): # Arch
-        package_managers["pacman"] = "pacman"
-    
-    return package_managers
+    return {
+        manager: manager
+        for manager in _PACKAGE_MANAGERS
+        if is_tool_available(manager)
+    }
 
 
+@functools.lru_cache(maxsize=None)
 def detect_platform():
     """Detect the current platform.
     
@@ -0,0 +1,51 @@
+"""JSON serialization helpers for APM-CLI configuration files and registry payloads."""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional, faster JSON codec
+    orjson = None
+
+
+def loads(raw):
+    """Decode a JSON document from raw bytes.
+
+    The bytes are handed straight to the parser, without an intermediate
+    ``str`` copy: orjson is used when it is installed, otherwise the standard
+    library parser (which detects the UTF encoding itself).
+
+    Args:
+        raw (bytes): Raw JSON document.
+
+    Returns:
+        Any: Decoded JSON payload.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dumps(obj):
+    """Serialize an object to a JSON document indented by two spaces.
+
+    orjson is used when it is installed. The standard library fallback
+    produces the same text, so files written by either backend are identical.
+    Objects orjson cannot encode (such as non-string keys) are handed to the
+    standard library as well.
+
+    Args:
+        obj: JSON-serializable object.
+
+    Returns:
+        str: JSON document.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False)
@@ -1,10 +1,62 @@
 """Discovery functionality for workflow files."""
 
 import os
-import glob
 from .parser import parse_workflow_file
 
 
+# Suffix of workflow prompt files
+_PROMPT_SUFFIX = ".prompt.md"
+
+# Directories that are never searched for workflows
+_PRUNED_DIRS = frozenset({"node_modules"})
+
+
+def _iter_prompt_files(base_dir):
+    """Walk base_dir and yield the paths of workflow prompt files.
+    
+    Files in VSCode's .github/prompts convention are yielded before generic
+    .prompt.md files. Hidden files and directories are skipped, except for
+    .github/prompts, and symlinked directories are not followed.
+    
+    Args:
+        base_dir (str): Directory to search in.
+    
+    Yields:
+        str: Path to a .prompt.md file.
+    """
+    generic_files = []
+    stack = [base_dir]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if name == ".github":
+                        # VSCode convention: .github/prompts/
+                        prompts_dir = os.path.join(entry.path, "prompts")
+                        try:
+                            with os.scandir(prompts_dir) as prompt_entries:
+                                for prompt_entry in prompt_entries:
+                                    if (prompt_entry.name.endswith(_PROMPT_SUFFIX)
+                                            and prompt_entry.name[0] != "."
+                                            and prompt_entry.is_file()):
+                                        yield prompt_entry.path
+                        except OSError:
+                            pass
+                    elif name[0] != "." and name not in _PRUNED_DIRS:
+                        stack.append(entry.path)
+                elif name.endswith(_PROMPT_SUFFIX) and name[0] != "." and entry.is_file():
+                    # Generic .prompt.md files
+                    generic_files.append(entry.path)
+    
+    yield from generic_files
+
+
 def discover_workflows(base_dir=None):
     """Find all .prompt.md files following VSCode's .github/prompts convention.
     
@@ -17,26 +69,8 @@ def discover_workflows(base_dir=None):
     if base_dir is None:
         base_dir = os.getcwd()
     
-    # Support VSCode's .github/prompts convention with .prompt.md files
-    prompt_patterns = [
-        "**/.github/prompts/*.prompt.md",     # VSCode convention: .github/prompts/
-        "**/*.prompt.md"                      # Generic .prompt.md files
-    ]
-    
-    workflow_files = []
-    for pattern in prompt_patterns:
-        workflow_files.extend(glob.glob(os.path.join(base_dir, pattern), recursive=True))
-    
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_files = []
-    for file_path in workflow_files:
-        if file_path not in seen:
-            seen.add(file_path)
-            unique_files.append(file_path)
-    
     workflows = []
-    for file_path in unique_files:
+    for file_path in _iter_prompt_files(base_dir):
         try:
             workflow = parse_workflow_file(file_path)
             workflows.append(workflow)
@@ -1,7 +1,22 @@
 """Parser for workflow definition files."""
 
 import os
-import frontmatter
+import re
+
+
+# Frontmatter delimiter line, as recognized by python-frontmatter
+_FM_BOUNDARY = re.compile(r"^-{3,}\s*$", re.MULTILINE)
+
+# Keys and plain scalars accepted by the fast frontmatter parser. Values that
+# YAML could read as anything other than the same plain string (quotes, flow
+# collections, comments, numbers, booleans, ...) are left to PyYAML.
+_FM_KEY = re.compile(r"[A-Za-z_][\w-]*")
+_FM_SCALAR = re.compile(r"[A-Za-z][^#:]*")
+_YAML_KEYWORDS = frozenset(
+    word
+    for base in ("yes", "no", "true", "false", "on", "off", "null")
+    for word in (base, base.capitalize(), base.upper())
+)
 
 
 class WorkflowDefinition:
@@ -46,21 +61,105 @@ def parse_workflow_file(file_path):
     
     Returns:
         WorkflowDefinition: Parsed workflow definition.
+    
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file cannot be read or parsed.
     """
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            post = frontmatter.load(f)
+            metadata, content = _parse_frontmatter(f.read())
         
         # Extract name based on file structure
         name = _extract_workflow_name(file_path)
-        metadata = post.metadata
-        content = post.content
         
         return WorkflowDefinition(name, file_path, metadata, content)
+    except FileNotFoundError:
+        raise
     except Exception as e:
         raise ValueError(f"Failed to parse workflow file: {e}")
 
 
+def _parse_frontmatter(text):
+    """Split a workflow file into frontmatter metadata and content.
+    
+    Workflow frontmatter is usually a flat mapping of plain strings and
+    simple lists, which is parsed directly. Anything else is handed to
+    python-frontmatter, so the result is always what it would return.
+    
+    Args:
+        text (str): Raw workflow file text.
+    
+    Returns:
+        tuple: Metadata dictionary and content string.
+    """
+    text = text.strip()
+    parts = _FM_BOUNDARY.split(text, 2) if _FM_BOUNDARY.match(text) else None
+    if parts is not None and len(parts) == 3:
+        metadata = _parse_simple_yaml(parts[1])
+        if metadata is not None:
+            return metadata, parts[2].strip()
+    
+    import frontmatter
+    post = frontmatter.loads(text)
+    return post.metadata, post.content
+
+
+def _parse_simple_yaml(block):
+    """Parse a flat YAML mapping of plain strings and lists of plain strings.
+    
+    Args:
+        block (str): YAML text between the frontmatter delimiters.
+    
+    Returns:
+        dict: Parsed mapping, or None if the block uses any other YAML syntax.
+    """
+    if "\t" in block:
+        return None
+    
+    metadata = {}
+    list_key = None
+    list_indent = None
+    for line in block.split("\n"):
+        stripped = line.strip(" ")
+        if not stripped or stripped[0] == "#":
+            continue
+        if line[0] == " ":
+            # List item under the preceding empty-valued key
+            if list_key is None or not stripped.startswith("- "):
+                return None
+            indent = len(line) - len(line.lstrip(" "))
+            if list_indent is None:
+                list_indent = indent
+            item = stripped[2:].strip(" ")
+            if (indent != list_indent or not _FM_SCALAR.fullmatch(item)
+                    or item in _YAML_KEYWORDS or not item.isprintable()):
+                return None
+            metadata[list_key].append(item)
+            continue
+        
+        key, sep, value = line.partition(":")
+        if (not sep or not _FM_KEY.fullmatch(key) or key in _YAML_KEYWORDS
+                or value[:1] not in ("", " ")):
+            return None
+        value = value.strip(" ")
+        if list_key is not None and not metadata[list_key]:
+            # An empty value that is not followed by list items is null
+            return None
+        if not value:
+            metadata[key] = []
+            list_key, list_indent = key, None
+            continue
+        if not _FM_SCALAR.fullmatch(value) or value in _YAML_KEYWORDS or not value.isprintable():
+            return None
+        metadata[key] = value
+        list_key = None
+    
+    if list_key is not None and not metadata[list_key]:
+        return None
+    return metadata
+
+
 def _extract_workflow_name(file_path):
     """Extract workflow name from file path based on naming conventions.
     
@@ -1,32 +1,82 @@
 """Runner for workflow execution."""
 
+import functools
 import os
 import re
 from colorama import Fore, Style
-from .parser import WorkflowDefinition
+from .parser import WorkflowDefinition, parse_workflow_file
 from .discovery import discover_workflows
-from ..runtime.factory import RuntimeFactory
+
+__all__ = [
+    "substitute_parameters",
+    "collect_parameters",
+    "find_workflow_by_name",
+    "clear_workflow_cache",
+    "run_workflow",
+    "preview_workflow",
+]
 
 # Color constants (matching cli.py)
 WARNING = f"{Fore.YELLOW}"
 RESET = f"{Style.RESET_ALL}"
 
+# ${input:name} parameter placeholder; the first group is the parameter name
+_PLACEHOLDER_RE = re.compile(r"\$\{input:([^}]+)\}")
+
+# Suffixes of names that refer to a workflow file rather than a workflow name
+_SUFFIXES = (".prompt.md", ".workflow.md")
+
+# Imported on first use by _runtime_factory(), since only run_workflow needs it
+RuntimeFactory = None
+
+# Workflows discovered by find_workflow_by_name, indexed by name, per base directory
+_workflow_indexes = {}
+
 
 def substitute_parameters(content, params):
-    """Simple string-based parameter substitution.
+    """Substitute ${input:name} placeholders in a single pass over the content.
+    
+    Values that are not strings are rendered by str.format, i.e. with str().
     
     Args:
         content (str): Content to substitute parameters in.
-        params (dict): Parameters to substitute.
+        params (dict): Parameters to substitute, keyed by name.
     
     Returns:
         str: Content with parameters substituted.
     """
-    result = content
-    for key, value in params.items():
-        placeholder = f"${{input:{key}}}"
-        result = result.replace(placeholder, str(value))
-    return result
+    if not params or "${input:" not in content:
+        return content
+    
+    template, names = _templatize(content)
+    return template.format(*[params.get(name, f"${{input:{name}}}") for name in names])
+
+
+@functools.lru_cache(maxsize=64)
+def _templatize(content):
+    """Turn content with ${input:name} placeholders into a str.format template.
+    
+    Placeholders become numbered fields, so parameter names never reach the
+    format-spec parser, and every other brace is escaped.
+    
+    Args:
+        content (str): Content with parameter placeholders.
+    
+    Returns:
+        tuple: (template, names) where field {i} stands for names[i].
+    """
+    parts = _PLACEHOLDER_RE.split(content)
+    names = []
+    fields = {}
+    for i in range(1, len(parts), 2):
+        name = parts[i]
+        if name not in fields:
+            fields[name] = len(names)
+            names.append(name)
+        parts[i] = f"{{{fields[name]}}}"
+    for i in range(0, len(parts), 2):
+        parts[i] = parts[i].replace("{", "{{").replace("}", "}}")
+    return "".join(parts), tuple(names)
 
 
 def collect_parameters(workflow_def, provided_params=None):
@@ -45,17 +95,13 @@ def collect_parameters(workflow_def, provided_params=None):
     if not workflow_def.input_parameters:
         return provided_params
     
-    # Convert list parameters to dict if they're just names
-    if isinstance(workflow_def.input_parameters, list):
-        # List of parameter names
-        param_names = workflow_def.input_parameters
-    else:
-        # Already a dict
-        param_names = list(workflow_def.input_parameters.keys())
-    
-    missing_params = [p for p in param_names if p not in provided_params]
+    # Input parameters are a list of names or a dict keyed by name; iterating
+    # either yields the names in declaration order. The set difference does
+    # the membership tests in C; the ordered list is only needed for prompting.
+    missing = set(workflow_def.input_parameters).difference(provided_params)
     
-    if missing_params:
+    if missing:
+        missing_params = [p for p in workflow_def.input_parameters if p in missing]
         print(f"Workflow '{workflow_def.name}' requires the following parameters:")
         for param in missing_params:
             value = input(f"  {param}: ")
@@ -78,25 +124,107 @@ def find_workflow_by_name(name, base_dir=None):
         base_dir = os.getcwd()
     
     # If name looks like a file path, try to parse it directly
-    if name.endswith('.prompt.md') or name.endswith('.workflow.md'):
+    if name.endswith(_SUFFIXES):
         # Handle relative paths
         if not os.path.isabs(name):
             name = os.path.join(base_dir, name)
         
-        if os.path.exists(name):
-            try:
-                from .parser import parse_workflow_file
-                return parse_workflow_file(name)
-            except Exception as e:
-                print(f"Error parsing workflow file {name}: {e}")
-                return None
+        try:
+            return parse_workflow_file(name)
+        except FileNotFoundError:
+            # A file path never matches a workflow name, so there is nothing to search
+            return None
+        except Exception as e:
+            print(f"Error parsing workflow file {name}: {e}")
+            return None
     
     # Otherwise, search by name
-    workflows = discover_workflows(base_dir)
-    for workflow in workflows:
-        if workflow.name == name:
-            return workflow
-    return None
+    index = _discover_index(base_dir)
+    if name not in index:
+        # The workflow may have been added since the directory was indexed;
+        # rediscover this directory only, keeping the other directories' indexes
+        index = _discover_index(base_dir, refresh=True)
+    return index.get(name)
+
+
+def _discover_index(base_dir, refresh=False):
+    """Discover the workflows in a directory and index them by name.
+    
+    Results are cached per directory; call clear_workflow_cache() after
+    changing or removing workflow files.
+    
+    Args:
+        base_dir (str): Base directory to search in.
+        refresh (bool, optional): Rediscover the directory even if it is cached.
+    
+    Returns:
+        dict: WorkflowDefinition objects by name, first discovered wins.
+    """
+    index = None if refresh else _workflow_indexes.get(base_dir)
+    if index is None:
+        index = {}
+        for workflow in discover_workflows(base_dir):
+            index.setdefault(workflow.name, workflow)
+        _workflow_indexes[base_dir] = index
+    return index
+
+
+def clear_workflow_cache():
+    """Forget the workflows discovered by find_workflow_by_name."""
+    _workflow_indexes.clear()
+
+
+def _prepare_params(params):
+    """Copy parameters with string keys and values, dropping runtime options.
+    
+    Converting once up front means nothing downstream has to stringify the
+    same values again, and the caller's dict is never mutated.
+    
+    Args:
+        params (dict): Parameters as given by the caller.
+    
+    Returns:
+        dict: Workflow parameters as strings, without '_runtime' and '_llm'.
+    """
+    return {
+        str(key): value if isinstance(value, str) else str(value)
+        for key, value in params.items()
+        if key not in ('_runtime', '_llm')
+    }
+
+
+def _runtime_factory():
+    """Import the runtime factory the first time a workflow is executed.
+    
+    Previews and parameter handling never touch a runtime, so they do not pay
+    for loading the runtime adapters.
+    
+    Returns:
+        type: The RuntimeFactory class.
+    """
+    global RuntimeFactory
+    if RuntimeFactory is None:
+        from ..runtime.factory import RuntimeFactory as factory
+        RuntimeFactory = factory
+    return RuntimeFactory
+
+
+def _validation_errors(workflow):
+    """Validate a workflow, remembering the result on the workflow.
+    
+    Workflows found by name are cached in-process, so repeated runs of the
+    same workflow reuse its first validation.
+    
+    Args:
+        workflow (WorkflowDefinition): Workflow to validate.
+    
+    Returns:
+        list: List of validation errors.
+    """
+    errors = getattr(workflow, '_validation_errors', None)
+    if errors is None:
+        errors = workflow._validation_errors = workflow.validate()
+    return errors
 
 
 def run_workflow(workflow_name, params=None, base_dir=None):
@@ -112,9 +240,10 @@ def run_workflow(workflow_name, params=None, base_dir=None):
     """
     params = params or {}
     
-    # Extract runtime and model information
-    runtime_name = params.pop('_runtime', None)
-    fallback_llm = params.pop('_llm', None)
+    # Extract runtime and model information without mutating the caller's dict
+    runtime_name = params.get('_runtime')
+    fallback_llm = params.get('_llm')
+    params = _prepare_params(params)
     
     # Find the workflow
     workflow = find_workflow_by_name(workflow_name, base_dir)
@@ -122,7 +251,7 @@ def run_workflow(workflow_name, params=None, base_dir=None):
         return False, f"Workflow '{workflow_name}' not found."
     
     # Validate the workflow
-    errors = workflow.validate()
+    errors = _validation_errors(workflow)
     if errors:
         return False, f"Invalid workflow: {', '.join(errors)}"
     
@@ -142,17 +271,19 @@ def run_workflow(workflow_name, params=None, base_dir=None):
     
     # Always execute with runtime (use best available if not specified)
     try:
+        factory = _runtime_factory()
+        
         # Use specified runtime type or get best available
         if runtime_name:
             # Check if runtime_name is a valid runtime type
-            if RuntimeFactory.runtime_exists(runtime_name):
-                runtime = RuntimeFactory.create_runtime(runtime_name, llm_model)
+            if factory.runtime_exists(runtime_name):
+                runtime = factory.create_runtime(runtime_name, llm_model)
             else:
                 # Invalid runtime name - fail with clear error message
-                available_runtimes = [adapter.get_runtime_name() for adapter in RuntimeFactory._RUNTIME_ADAPTERS if adapter.is_available()]
+                available_runtimes = [adapter.get_runtime_name() for adapter in factory._RUNTIME_ADAPTERS if adapter.is_available()]
                 return False, f"Invalid runtime '{runtime_name}'. Available runtimes: {', '.join(available_runtimes)}"
         else:
-            runtime = RuntimeFactory.create_runtime(model_name=llm_model)
+            runtime = factory.create_runtime(model_name=llm_model)
         
         # Execute the prompt with the runtime
         response = runtime.execute_prompt(result_content)
@@ -173,7 +304,7 @@ def preview_workflow(workflow_name, params=None, base_dir=None):
     Returns:
         tuple: (bool, str) Success status and processed content.
     """
-    params = params or {}
+    params = _prepare_params(params or {})
     
     # Find the workflow
     workflow = find_workflow_by_name(workflow_name, base_dir)
@@ -181,7 +312,7 @@ def preview_workflow(workflow_name, params=None, base_dir=None):
         return False, f"Workflow '{workflow_name}' not found."
     
     # Validate the workflow
-    errors = workflow.validate()
+    errors = _validation_errors(workflow)
     if errors:
         return False, f"Invalid workflow: {', '.join(errors)}"
     
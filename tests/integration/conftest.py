@@ -0,0 +1,301 @@
+"""Shared fixtures for APM integration tests."""
+
+import json
+import os
+import shutil
+import subprocess
+import pytest
+import requests
+from click.testing import CliRunner
+from pathlib import Path
+from requests.adapters import BaseAdapter
+from urllib.parse import parse_qs, urlsplit
+from apm_cli.registry.client import SimpleRegistryClient
+
+# Public demo MCP registry used by the registry integration tests
+DEMO_REGISTRY_URL = "https://demo.registry.azure-mcp.net"
+
+# Query the real demo registry instead of the canned one below
+LIVE_REGISTRY = os.environ.get('APM_LIVE_REGISTRY', '').lower() in ('1', 'true', 'yes')
+
+# Server records served by the canned demo registry, modelled on real entries
+DEMO_REGISTRY_SERVERS = [
+    {
+        "id": "43515997-b00f-4472-bca4-6c47389e7685",
+        "name": "io.github.GLips/Figma-Context-MCP",
+        "description": "MCP server to provide Figma layout information to AI coding agents like Cursor",
+        "repository": {"url": "https://github.com/GLips/Figma-Context-MCP", "source": "github"},
+        "version_detail": {"version": "0.4.3", "release_date": "2025-06-05T00:00:00Z", "is_latest": True},
+        "packages": [
+            {
+                "registry_name": "npm",
+                "name": "figma-developer-mcp",
+                "version": "0.4.3",
+                "runtime_hint": "npx",
+                "runtime_arguments": [
+                    {"is_required": True, "format": "string", "value": "-y", "value_hint": "-y", "type": "positional"},
+                ],
+                "package_arguments": [
+                    {"is_required": True, "format": "string", "value": "--stdio", "value_hint": "--stdio", "type": "positional"},
+                ],
+                "environment_variables": [
+                    {"name": "FIGMA_API_KEY", "description": "Your Figma API access token"},
+                ],
+            }
+        ],
+    },
+    {
+        "id": "da0676e0-e495-46a7-a330-29e2e4bfc653",
+        "name": "io.github.box-community/mcp-server-box",
+        "description": "An MCP server capable of interacting with the Box API",
+        "repository": {"url": "https://github.com/box-community/mcp-server-box", "source": "github"},
+        "version_detail": {"version": "0.1.0", "release_date": "2025-05-20T00:00:00Z", "is_latest": True},
+        "packages": [
+            {
+                "registry_name": "pypi",
+                "name": "mcp-server-box",
+                "version": "0.1.0",
+                "runtime_hint": "uv",
+            }
+        ],
+    },
+    {
+        "id": "9a1c3e8e-6d2b-4f0a-8b7e-2f5d4c6a1b03",
+        "name": "io.github.github/github-mcp-server",
+        "description": "GitHub's official MCP Server",
+        "repository": {"url": "https://github.com/github/github-mcp-server", "source": "github"},
+        "version_detail": {"version": "0.5.0", "release_date": "2025-06-10T00:00:00Z", "is_latest": True},
+        "packages": [
+            {
+                "registry_name": "docker",
+                "name": "ghcr.io/github/github-mcp-server",
+                "version": "0.5.0",
+                "runtime_hint": "docker",
+                "environment_variables": [
+                    {"name": "GITHUB_PERSONAL_ACCESS_TOKEN", "description": "GitHub personal access token"},
+                ],
+            }
+        ],
+    },
+    {
+        "id": "4e8b2a71-0c5d-4b9e-a3f6-7d1e9c2b5a48",
+        "name": "io.github.modelcontextprotocol/fetch",
+        "description": "Web content fetching and conversion for efficient LLM usage",
+        "repository": {"url": "https://github.com/modelcontextprotocol/servers", "source": "github"},
+        "version_detail": {"version": "2025.4.7", "release_date": "2025-04-07T00:00:00Z", "is_latest": True},
+        "packages": [
+            {
+                "registry_name": "pypi",
+                "name": "mcp-server-fetch",
+                "version": "2025.4.7",
+                "runtime_hint": "uvx",
+            }
+        ],
+    },
+]
+
+
+def pytest_configure(config):
+    """Register the integration test markers.
+    
+    The pytest-xdist group marker is registered here too, so it is known
+    without the plugin.
+    """
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests of the same group on one pytest-xdist worker"
+    )
+    config.addinivalue_line("markers", "slow: takes longer than 30 seconds")
+    config.addinivalue_line("markers", "network: requires internet access")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Mark the registry tests as networked when they query the live registry."""
+    if not LIVE_REGISTRY:
+        return
+    for item in items:
+        if "registry_client" in getattr(item, "fixturenames", ()):
+            item.add_marker(pytest.mark.network)
+
+
+@pytest.fixture(scope="session")
+def temp_e2e_home(tmp_path_factory):
+    """Create a temporary home directory for E2E testing.
+    
+    The directory comes from tmp_path_factory, so each pytest-xdist worker
+    gets its own home and workers never share runtime installs.
+    """
+    return str(tmp_path_factory.mktemp("e2e_home"))
+
+
+@pytest.fixture(scope="session")
+def e2e_env(temp_e2e_home):
+    """Environment for commands run by E2E tests, with HOME pointing at the test home.
+    
+    Commands receive this mapping explicitly instead of the tests mutating
+    os.environ, so tests running in parallel cannot interfere. It is copied
+    from os.environ once per session; tests that need extra variables merge
+    them into a new dict rather than copying the environment again.
+    """
+    env = os.environ.copy()
+    env['HOME'] = temp_e2e_home
+    return env
+
+
+@pytest.fixture(scope="session")
+def apm_binary(tmp_path_factory):
+    """Get path to APM binary for testing.
+
+    Under pytest-xdist the first worker to resolve the binary records it in
+    the temp root shared by the session's workers, so the others reuse it.
+    """
+    shared = None
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        shared = tmp_path_factory.getbasetemp().parent / "apm_binary.txt"
+        if shared.is_file():
+            return shared.read_text()
+
+    binary = _find_apm_binary()
+
+    if shared is not None:
+        # Write atomically so a worker never reads a partial path
+        partial = shared.with_name(f"{shared.name}.{os.getpid()}")
+        partial.write_text(binary)
+        os.replace(partial, shared)
+    return binary
+
+
+def _find_apm_binary():
+    """Locate a working APM binary, skipping the calling test if there is none."""
+    # An apm on PATH is the installed CLI; use it without launching it
+    binary = shutil.which("apm")
+    if binary:
+        return binary
+
+    # Otherwise try local builds
+    possible_paths = [
+        "./apm",  # Local directory
+        "./dist/apm",  # Build directory
+        Path(__file__).parent.parent.parent / "dist" / "apm",  # Relative to test
+    ]
+
+    # shutil.which checks that explicit paths are executable files, so no
+    # candidate has to be launched to be found
+    for path in possible_paths:
+        binary = shutil.which(str(path))
+        if binary:
+            break
+    else:
+        pytest.skip("APM binary not found. Build it first with: python -m build")
+
+    # Launch the build once, as a sanity check
+    try:
+        result = subprocess.run([binary, "--version"], capture_output=True, text=True, timeout=30)
+    except (subprocess.TimeoutExpired, OSError) as e:
+        pytest.skip(f"APM binary {binary} is not usable: {e}")
+    if result.returncode != 0:
+        pytest.skip(f"APM binary {binary} is not usable: {result.stderr}")
+    return binary
+
+
+@pytest.fixture(scope="session")
+def cli_runner():
+    """Click runner for invoking the APM CLI in-process."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def apm_cli():
+    """APM CLI entry point, for tests that do not need the built binary."""
+    return pytest.importorskip("apm_cli.cli").cli
+
+
+@pytest.fixture(scope="session")
+def apm_smoke_outputs(cli_runner, apm_cli, temp_e2e_home):
+    """Results of the APM CLI smoke commands, collected once per session.
+    
+    Returns:
+        dict: Click results keyed by "version", "help" and "runtime_list".
+    """
+    commands = {
+        "version": ["--version"],
+        "help": ["--help"],
+        "runtime_list": ["runtime", "list"],
+    }
+    return {
+        name: cli_runner.invoke(apm_cli, args, env={"HOME": temp_e2e_home})
+        for name, args in commands.items()
+    }
+
+
+class _CannedRegistryAdapter(BaseAdapter):
+    """Transport adapter answering registry API requests from DEMO_REGISTRY_SERVERS."""
+    
+    def send(self, request, **kwargs):
+        url = urlsplit(request.url)
+        servers = {server["id"]: server for server in DEMO_REGISTRY_SERVERS}
+        status, payload = 404, {"error": "Not found"}
+        if url.path in ("", "/"):
+            status, payload = 200, {}
+        elif url.path == "/v0/servers":
+            limit = int(parse_qs(url.query).get("limit", ["100"])[0])
+            # Listings carry server summaries; the packages come with the details
+            summaries = [
+                {key: value for key, value in server.items() if key != "packages"}
+                for server in DEMO_REGISTRY_SERVERS[:limit]
+            ]
+            status, payload = 200, {"servers": summaries, "metadata": {"count": len(summaries)}}
+        elif url.path.startswith("/v0/servers/") and url.path[len("/v0/servers/"):] in servers:
+            status, payload = 200, servers[url.path[len("/v0/servers/"):]]
+        
+        response = requests.Response()
+        response.status_code = status
+        response.reason = "OK" if status == 200 else "Not Found"
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps(payload).encode("utf-8")
+        response.url = request.url
+        response.request = request
+        return response
+    
+    def close(self):
+        pass
+
+
+@pytest.fixture(scope="session")
+def registry_client():
+    """Registry client for the demo registry, shared by the whole session.
+    
+    Unless APM_LIVE_REGISTRY=1 is set, the client gets a session of its own
+    that answers from DEMO_REGISTRY_SERVERS in memory, so the registry tests
+    run offline. Against the live registry, its reachability is probed once;
+    when it cannot be reached, every test using the client is skipped. The
+    probe goes through the client's pooled session, so the tests reuse its
+    keep-alive connection.
+    """
+    client = SimpleRegistryClient(DEMO_REGISTRY_URL)
+    if not LIVE_REGISTRY:
+        # A session of the client's own, since the pooled one is shared by
+        # every client of the registry in this process
+        client.session = requests.Session()
+        client.session.mount(DEMO_REGISTRY_URL, _CannedRegistryAdapter())
+        return client
+    
+    try:
+        response = client.session.head(DEMO_REGISTRY_URL, timeout=10)
+        response.raise_for_status()
+    except (requests.RequestException, ValueError):
+        pytest.skip("Demo registry is not accessible")
+    return client
+
+
+@pytest.fixture(scope="session")
+def server_listing(registry_client):
+    """First page of the demo registry's servers, listed once per session.
+    
+    Returns:
+        list: Server entries as returned by list_servers().
+    """
+    try:
+        servers, _ = registry_client.list_servers()
+    except (requests.RequestException, ValueError) as e:
+        pytest.skip(f"Could not list servers from demo registry: {e}")
+    return servers
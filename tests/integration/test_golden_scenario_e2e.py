@@ -24,122 +24,239 @@ To run these tests, you need:
 - Network access to download runtimes and make API calls
 """
 
+import asyncio
+import codecs
 import os
+import re
+import shlex
+import signal
 import subprocess
-import tempfile
 import shutil
+import time
 import pytest
 import json
 from pathlib import Path
 from unittest import mock
 
 
-# Skip all tests in this module if not in E2E mode
+# Skip the runtime and API tests in this module if not in E2E mode
 E2E_MODE = os.environ.get('APM_E2E_TESTS', '').lower() in ('1', 'true', 'yes')
 GITHUB_TOKEN = os.environ.get('GITHUB_TOKEN')
 
-pytestmark = pytest.mark.skipif(
+requires_e2e = pytest.mark.skipif(
     not E2E_MODE, 
     reason="E2E tests only run when APM_E2E_TESTS=1 is set"
 )
 
+# Print generated files for debugging; off by default so runs skip the extra reads
+VERBOSE = os.environ.get('APM_E2E_VERBOSE', '') == '1'
 
-def run_command(cmd, check=True, capture_output=True, timeout=180, cwd=None, show_output=False):
-    """Run a shell command with proper error handling."""
+# The substituted parameter value, matched without lowercasing the whole output
+_PARAM_RE = re.compile(r"developer", re.IGNORECASE)
+
+# Common causes of a failed run, classified in a single scan of the output
+_FAILURE_RE = re.compile(r"(?P<token>GITHUB_TOKEN)|(?P<network>Connection|(?i:timeout))")
+
+
+def _walk_files(root):
+    """Yield the paths of all files under root in one scandir pass, without following symlinks."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry.path
+
+
+def _kill_process_group(process):
+    """Kill a command started in its own session, along with its children.
+    
+    Runtime setup scripts and 'apm run' start child processes of their own
+    that hold the output pipe open, so killing only the command would leave
+    the pipe open until they exit. The group is killed even when the command
+    itself has already exited, since its children may still be running.
+    """
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except ProcessLookupError:
+        pass
+
+
+def stream_command(cmd, timeout, cwd=None, env=None):
+    """Run a command, echoing its output as it arrives and capturing it.
+    
+    The output pipe is drained in 64 KiB reads on an asyncio event loop
+    rather than line by line, and the timeout covers the whole run.
+    
+    Returns:
+        tuple: (return code, combined stdout and stderr text).
+    
+    Raises:
+        subprocess.TimeoutExpired: If the command outlives the timeout; its
+            output holds what the command printed before it was killed.
+    """
+    return asyncio.run(_stream_command(cmd, timeout, cwd, env))
+
+
+async def _stream_command(cmd, timeout, cwd, env):
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,  # Merge stderr into stdout
+        cwd=cwd,
+        env=env,
+        start_new_session=True  # Own process group, so a timeout kills its children too
+    )
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    output = []
+    
+    async def drain():
+        while True:
+            chunk = await process.stdout.read(65536)
+            text = decoder.decode(chunk, final=not chunk)
+            print(text, end='', flush=True)
+            output.append(text)
+            if not chunk:
+                return await process.wait()
+    
+    try:
+        return_code = await asyncio.wait_for(drain(), timeout)
+    except asyncio.TimeoutError:
+        _kill_process_group(process)
+        # Keep whatever is still buffered in the pipe for the failure report
+        try:
+            remaining = await asyncio.wait_for(process.stdout.read(), 5)
+        except asyncio.TimeoutError:
+            remaining = b''
+        output.append(decoder.decode(remaining, final=True))
+        await process.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout, output=''.join(output))
+    except BaseException:
+        # The command's own session does not receive Ctrl-C from the terminal
+        _kill_process_group(process)
+        raise
+    finally:
+        # Close the subprocess transport while the loop is still running;
+        # otherwise its finalizer runs after asyncio.run has closed the loop
+        process._transport.close()
+    return return_code, ''.join(output)
+
+
+def run_command(cmd, check=True, capture_output=True, timeout=180, cwd=None, show_output=False, env=None):
+    """Run a command with proper error handling.
+    
+    The command is an argv list (a string is split with shlex) and runs
+    without a shell, so a timeout kills the command itself.
+    """
+    if isinstance(cmd, str):
+        cmd = shlex.split(cmd)
     try:
         if show_output:
-            # For commands we want to see output from (like runtime setup and execution)
-            print(f"\n>>> Running command: {cmd}")
-            result = subprocess.run(
-                cmd, 
-                shell=True, 
-                check=check, 
-                capture_output=False,  # Don't capture, let it stream to terminal
-                text=True,
-                timeout=timeout,
-                cwd=cwd
-            )
-            # For show_output commands, we need to capture in a different way to return something
-            # Run again with capture to get return data
-            result_capture = subprocess.run(
-                cmd, 
-                shell=True, 
-                check=False,  # Don't fail here, we already ran it above
-                capture_output=True, 
-                text=True,
-                timeout=timeout,
-                cwd=cwd
-            )
-            result.stdout = result_capture.stdout
-            result.stderr = result_capture.stderr
+            # For commands we want to see output from (like runtime setup and execution),
+            # stream the output to the terminal while capturing it in a single run
+            print(f"\n>>> Running command: {shlex.join(cmd)}")
+            return_code, output = stream_command(cmd, timeout, cwd=cwd, env=env)
+            if check and return_code != 0:
+                raise subprocess.CalledProcessError(return_code, cmd, output=output, stderr='')
+            result = subprocess.CompletedProcess(cmd, return_code, stdout=output, stderr='')
         else:
-            result = subprocess.run(
-                cmd, 
-                shell=True, 
-                check=check, 
-                capture_output=capture_output, 
+            pipe = subprocess.PIPE if capture_output else None
+            with subprocess.Popen(
+                cmd,
+                stdout=pipe,
+                stderr=pipe,
                 text=True,
-                timeout=timeout,
-                cwd=cwd
-            )
+                cwd=cwd,
+                env=env,
+                start_new_session=True  # Own process group, so a timeout kills its children too
+            ) as process:
+                try:
+                    stdout, stderr = process.communicate(timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    _kill_process_group(process)
+                    stdout, stderr = process.communicate()
+                    raise subprocess.TimeoutExpired(cmd, timeout, output=stdout, stderr=stderr)
+                except BaseException:
+                    # The command's own session does not receive Ctrl-C from the terminal
+                    _kill_process_group(process)
+                    raise
+            if check and process.returncode != 0:
+                raise subprocess.CalledProcessError(process.returncode, cmd, output=stdout, stderr=stderr)
+            result = subprocess.CompletedProcess(cmd, process.returncode, stdout=stdout, stderr=stderr)
         return result
-    except subprocess.TimeoutExpired:
-        pytest.fail(f"Command timed out after {timeout}s: {cmd}")
+    except subprocess.TimeoutExpired as e:
+        output = e.output or ''
+        pytest.fail(f"Command timed out after {timeout}s: {shlex.join(cmd)}\nPartial output:\n{output[-4000:]}")
     except subprocess.CalledProcessError as e:
-        pytest.fail(f"Command failed: {cmd}\nStdout: {e.stdout}\nStderr: {e.stderr}")
+        pytest.fail(f"Command failed: {shlex.join(cmd)}\nStdout: {e.stdout}\nStderr: {e.stderr}")
 
 
-@pytest.fixture(scope="module")
-def temp_e2e_home():
-    """Create a temporary home directory for E2E testing."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        original_home = os.environ.get('HOME')
-        test_home = os.path.join(temp_dir, 'e2e_home')
-        os.makedirs(test_home)
-        
-        # Set up test environment
-        os.environ['HOME'] = test_home
-        
-        # Preserve GITHUB_TOKEN
-        if GITHUB_TOKEN:
-            os.environ['GITHUB_TOKEN'] = GITHUB_TOKEN
-        
-        yield test_home
-        
-        # Restore original environment
-        if original_home:
-            os.environ['HOME'] = original_home
-        else:
-            del os.environ['HOME']
-
-
-@pytest.fixture(scope="module")
-def apm_binary():
-    """Get path to APM binary for testing."""
-    # Try to find APM binary in common locations
-    possible_paths = [
-        "apm",  # In PATH
-        "./apm",  # Local directory
-        "./dist/apm",  # Build directory
-        Path(__file__).parent.parent.parent / "dist" / "apm",  # Relative to test
-    ]
+@pytest.fixture(scope="session")
+def codex_runtime(temp_e2e_home, e2e_env, apm_binary):
+    """Install the Codex runtime once for all tests that need it."""
+    print("Installing Codex runtime...")
+    result = run_command([apm_binary, "runtime", "setup", "codex"], timeout=300, show_output=True, env=e2e_env)
+    assert result.returncode == 0, f"Runtime setup failed: {result.stderr}"
+    return Path(temp_e2e_home) / ".apm" / "runtimes" / "codex"
+
+
+@pytest.fixture(scope="session")
+def llm_runtime(temp_e2e_home, e2e_env, apm_binary):
+    """Install the LLM runtime once for all tests that need it."""
+    print("\n=== Setting up LLM runtime ===")
+    result = run_command([apm_binary, "runtime", "setup", "llm"], timeout=300, env=e2e_env)
+    assert result.returncode == 0, f"LLM runtime setup failed: {result.stderr}"
+    return Path(temp_e2e_home) / ".apm" / "runtimes" / "llm"
+
+
+@pytest.fixture(scope="session")
+def installed_runtimes(codex_runtime, llm_runtime):
+    """Both runtimes, each installed once per session, by name."""
+    return {"codex": codex_runtime, "llm": llm_runtime}
+
+
+@pytest.fixture(scope="session")
+def reference_project(e2e_env, apm_binary, tmp_path_factory):
+    """Initialize the golden scenario project and install its dependencies once.
     
-    for path in possible_paths:
-        try:
-            result = subprocess.run([str(path), "--version"], capture_output=True, text=True)
-            if result.returncode == 0:
-                return str(path)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            continue
+    Tests copy this project into their own workspace instead of repeating
+    'apm init' and 'apm install'.
+    """
+    workspace = tmp_path_factory.mktemp("reference")
+    project_dir = workspace / "my-ai-native-project"
     
-    pytest.skip("APM binary not found. Build it first with: python -m build")
+    result = run_command([apm_binary, "init", "my-ai-native-project", "--yes"], cwd=workspace, show_output=True, env=e2e_env)
+    assert result.returncode == 0, f"Project init failed: {result.stderr}"
+    
+    result = run_command([apm_binary, "install"], cwd=project_dir, show_output=True, env=e2e_env)
+    assert result.returncode == 0, f"Dependency install failed: {result.stderr}"
+    return project_dir
+
+
+def copy_reference_project(reference_project, project_dir):
+    """Copy the reference project into a test workspace.
+    
+    Files are hardlinked rather than copied, which costs next to nothing since
+    every workspace shares pytest's base temp directory. The tests only add
+    files (such as the compiled AGENTS.md) to their copy; a test that rewrites
+    a file from the reference project must delete it first, or the write would
+    reach the other tests' copies too.
+    """
+    shutil.copytree(reference_project, project_dir, symlinks=True, copy_function=os.link)
 
 
+@requires_e2e
 class TestGoldenScenarioE2E:
     """End-to-end tests for the exact README hero quick start scenario."""
     
     @pytest.mark.skipif(not GITHUB_TOKEN, reason="GITHUB_TOKEN required for E2E tests")
-    def test_complete_golden_scenario_codex(self, temp_e2e_home, apm_binary):
+    @pytest.mark.slow
+    @pytest.mark.network
+    @pytest.mark.xdist_group("codex")
+    def test_complete_golden_scenario_codex(self, temp_e2e_home, e2e_env, apm_binary, codex_runtime, reference_project, tmp_path):
         """Test the complete hero quick start from README using Codex runtime.
         
         Validates the exact 6-step flow:
@@ -151,15 +268,13 @@ class TestGoldenScenarioE2E:
         6. apm run start --param name="Developer"
         """
         
-        # Step 1: Setup Codex runtime (equivalent to: apm runtime setup codex)
+        # Step 1: Setup Codex runtime (equivalent to: apm runtime setup codex),
+        # installed once per session by the codex_runtime fixture
         print("\n=== Step 2: Set up your GitHub PAT and an Agent CLI ===")
         print("GITHUB_TOKEN: ✓ (set via environment)")
-        print("Installing Codex runtime...")
-        result = run_command(f"{apm_binary} runtime setup codex", timeout=300, show_output=True)
-        assert result.returncode == 0, f"Runtime setup failed: {result.stderr}"
         
         # Verify codex is available and GitHub configuration was created
-        codex_binary = Path(temp_e2e_home) / ".apm" / "runtimes" / "codex"
+        codex_binary = codex_runtime
         codex_config = Path(temp_e2e_home) / ".codex" / "config.toml"
         
         assert codex_binary.exists(), "Codex binary not installed"
@@ -169,43 +284,47 @@ class TestGoldenScenarioE2E:
         config_content = codex_config.read_text()
         assert "github-models" in config_content, "GitHub Models configuration not found"
         assert "GITHUB_TOKEN" in config_content, "GitHub token environment variable not configured"
-        print(f"✓ Codex configuration created:\n{config_content}")
+        print("✓ Codex configuration created")
+        if VERBOSE:
+            print(config_content)
         
-        # Test codex binary directly
-        print("\n=== Testing Codex binary directly ===")
-        result = run_command(f"{codex_binary} --version", show_output=True)
-        if result.returncode == 0:
-            print(f"✓ Codex version: {result.stdout}")
-        else:
-            print(f"⚠ Codex version check failed: {result.stderr}")
+        # Test codex binary directly; the version is only reported, so skip the launch unless verbose
+        if VERBOSE:
+            print("\n=== Testing Codex binary directly ===")
+            result = run_command([str(codex_binary), "--version"], check=False, show_output=True, env=e2e_env)
+            if result.returncode == 0:
+                print(f"✓ Codex version: {result.stdout}")
+            else:
+                print(f"⚠ Codex version check failed: {result.stderr}")
             
         # Check if codex is in PATH
         print("\n=== Checking PATH setup ===")
-        result = run_command("which codex", check=False)
-        if result.returncode == 0:
-            print(f"✓ Codex found in PATH: {result.stdout.strip()}")
+        codex_in_path = shutil.which("codex", path=e2e_env.get("PATH"))
+        if codex_in_path:
+            print(f"✓ Codex found in PATH: {codex_in_path}")
         else:
             print("⚠ Codex not in PATH, will need explicit path or shell restart")
         
-        # Step 2: Initialize project (equivalent to: apm init my-ai-native-project) 
-        with tempfile.TemporaryDirectory() as project_workspace:
-            project_dir = Path(project_workspace) / "my-ai-native-project"
-            
-            print("\n=== Step 3: Transform your project with AI-Native structure ===")
-            result = run_command(f"{apm_binary} init my-ai-native-project --yes", cwd=project_workspace, show_output=True)
-            assert result.returncode == 0, f"Project init failed: {result.stderr}"
-            assert project_dir.exists(), "Project directory not created"
-            
-            # Verify project structure
-            assert (project_dir / "apm.yml").exists(), "apm.yml not created"
-            assert (project_dir / "hello-world.prompt.md").exists(), "Prompt file not created"
-            
-            # Critical: Verify Agent Primitives (.apm directory) are created
-            apm_dir = project_dir / ".apm"
-            assert apm_dir.exists(), "Agent Primitives directory (.apm) not created - TEMPLATE BUNDLING FAILED"
-            
-            print(f"✓ Verified Agent Primitives directory (.apm) exists")
-            
+        # Step 2: Initialize project (equivalent to: apm init my-ai-native-project),
+        # copied from the project the reference_project fixture initialized once
+        project_workspace = tmp_path
+        project_dir = Path(project_workspace) / "my-ai-native-project"
+        
+        print("\n=== Step 3: Transform your project with AI-Native structure ===")
+        copy_reference_project(reference_project, project_dir)
+        assert project_dir.exists(), "Project directory not created"
+        
+        # Verify project structure
+        assert (project_dir / "apm.yml").exists(), "apm.yml not created"
+        assert (project_dir / "hello-world.prompt.md").exists(), "Prompt file not created"
+        
+        # Critical: Verify Agent Primitives (.apm directory) are created
+        apm_dir = project_dir / ".apm"
+        assert apm_dir.exists(), "Agent Primitives directory (.apm) not created - TEMPLATE BUNDLING FAILED"
+        
+        print(f"✓ Verified Agent Primitives directory (.apm) exists")
+        
+        if VERBOSE:
             # Show project contents for debugging
             print("\n=== Project structure ===")
             apm_yml_content = (project_dir / "apm.yml").read_text()
@@ -214,263 +333,240 @@ class TestGoldenScenarioE2E:
             print(f"hello-world.prompt.md:\n{prompt_content[:500]}...")
             
             # List Agent Primitives for verification
-            if apm_dir.exists():
-                agent_primitives = list(apm_dir.rglob("*"))
-                agent_files = [f for f in agent_primitives if f.is_file()]
-                print(f"\n=== Agent Primitives Files ({len(agent_files)} found) ===")
-                for f in sorted(agent_files):
-                    rel_path = f.relative_to(project_dir)
-                    print(f"  {rel_path}")
-            else:
-                print(f"\n❌ Agent Primitives directory (.apm) missing - TEMPLATE BUNDLING FAILED")
-            
-            # Step 4: Compile Agent Primitives for any coding agent (equivalent to: apm compile)
-            print("\n=== Step 4: Compile Agent Primitives for any coding agent ===")
-            result = run_command(f"{apm_binary} compile", cwd=project_dir, show_output=True)
-            assert result.returncode == 0, f"Agent Primitives compilation failed: {result.stderr}"
-            
-            # Verify agents.md was generated
-            agents_md = project_dir / "AGENTS.md"
-            assert agents_md.exists(), "AGENTS.md not generated by compile step"
-            
-            # Show agents.md content for verification
+            agent_files = sorted(_walk_files(apm_dir))
+            print(f"\n=== Agent Primitives Files ({len(agent_files)} found) ===")
+            for f in agent_files:
+                rel_path = os.path.relpath(f, project_dir)
+                print(f"  {rel_path}")
+        
+        # Step 4: Compile Agent Primitives for any coding agent (equivalent to: apm compile)
+        print("\n=== Step 4: Compile Agent Primitives for any coding agent ===")
+        result = run_command([apm_binary, "compile"], cwd=project_dir, show_output=True, env=e2e_env)
+        assert result.returncode == 0, f"Agent Primitives compilation failed: {result.stderr}"
+        
+        # Verify agents.md was generated
+        agents_md = project_dir / "AGENTS.md"
+        assert agents_md.exists(), "AGENTS.md not generated by compile step"
+        
+        # Show agents.md content for verification
+        if VERBOSE:
             agents_content = agents_md.read_text()
             print(f"\n=== Generated AGENTS.md (first 500 chars) ===")
             print(f"{agents_content[:500]}...")
+        
+        # Step 5: Install MCP dependencies (equivalent to: apm install),
+        # already run on the reference project the test copied
+        
+        # Step 6: Execute agentic workflows (equivalent to: apm run start --param name="Developer")
+        print("\n=== Step 6: Execute agentic workflows ===")
+        print(f"Environment: HOME={temp_e2e_home}, GITHUB_TOKEN={'SET' if GITHUB_TOKEN else 'NOT SET'}")
+        
+        # Add explicit GITHUB_TOKEN to the environment for this run
+        env = {**e2e_env, 'GITHUB_TOKEN': GITHUB_TOKEN}
+        
+        # Run with real-time output streaming
+        cmd = [apm_binary, "run", "start", "--param", "name=Developer"]
+        
+        print("\n--- Codex Execution Output ---")
+        
+        # Stream output in real-time; a timeout fails the test with the partial output
+        result = run_command(cmd, check=False, timeout=120, cwd=project_dir, show_output=True, env=env)
+        return_code, full_output = result.returncode, result.stdout
+        
+        print("--- End Codex Output ---\n")
+        
+        # Verify execution
+        if return_code != 0:
+            print(f"❌ Command failed with return code: {return_code}")
+            print(f"Full output:\n{full_output}")
             
-            # Step 5: Install MCP dependencies (equivalent to: apm install)
-            print("\n=== Step 5: Install MCP dependencies ===")
-            result = run_command(f"{apm_binary} install", cwd=project_dir, show_output=True)
-            assert result.returncode == 0, f"Dependency install failed: {result.stderr}"
-            
-            # Step 6: Execute agentic workflows (equivalent to: apm run start --param name="Developer")
-            print("\n=== Step 6: Execute agentic workflows ===")
-            print(f"Environment: HOME={temp_e2e_home}, GITHUB_TOKEN={'SET' if GITHUB_TOKEN else 'NOT SET'}")
-            
-            # Add explicit GITHUB_TOKEN to the environment for this run
-            env = os.environ.copy()
-            env['GITHUB_TOKEN'] = GITHUB_TOKEN
-            env['HOME'] = temp_e2e_home
-            
-            # Run with real-time output streaming
-            cmd = f'{apm_binary} run start --param name="Developer"'
-            print(f"Executing: {cmd}")
-            
-            try:
-                process = subprocess.Popen(
-                    cmd,
-                    shell=True,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,  # Merge stderr into stdout
-                    text=True,
-                    cwd=project_dir,
-                    env=env
-                )
-                
-                output_lines = []
-                print("\n--- Codex Execution Output ---")
-                
-                # Stream output in real-time
-                for line in iter(process.stdout.readline, ''):
-                    if line:
-                        print(line.rstrip())  # Print to terminal
-                        output_lines.append(line)
-                
-                # Wait for completion
-                return_code = process.wait(timeout=120)
-                full_output = ''.join(output_lines)
-                
-                print("--- End Codex Output ---\n")
-                
-                # Verify execution
-                if return_code != 0:
-                    print(f"❌ Command failed with return code: {return_code}")
-                    print(f"Full output:\n{full_output}")
-                    
-                    # Check for common issues
-                    if "GITHUB_TOKEN" in full_output:
-                        pytest.fail("Codex execution failed: GitHub token not properly configured")
-                    elif "Connection" in full_output or "timeout" in full_output.lower():
-                        pytest.fail("Codex execution failed: Network connectivity issue")
-                    else:
-                        pytest.fail(f"Golden scenario execution failed with return code {return_code}: {full_output}")
-                
-                # Verify output contains expected elements (using "Developer" instead of "E2E Tester")
-                output_lower = full_output.lower()
-                assert "developer" in output_lower, \
-                    f"Parameter substitution failed. Expected 'Developer', got: {full_output}"
-                assert len(full_output.strip()) > 50, \
-                    f"Output seems too short, API call might have failed. Output: {full_output}"
-                
-                print(f"\n✅ Golden scenario completed successfully!")
-                print(f"Output length: {len(full_output)} characters")
-                print(f"Contains parameter: {'✓' if 'developer' in output_lower else '❌'}")
-                
-            except subprocess.TimeoutExpired:
-                process.kill()
-                pytest.fail("Codex execution timed out after 120 seconds")
+            # Check for common issues
+            issues = {match.lastgroup for match in _FAILURE_RE.finditer(full_output)}
+            if "token" in issues:
+                pytest.fail("Codex execution failed: GitHub token not properly configured")
+            elif "network" in issues:
+                pytest.fail("Codex execution failed: Network connectivity issue")
+            else:
+                pytest.fail(f"Golden scenario execution failed with return code {return_code}: {full_output}")
+        
+        # Verify output contains expected elements (using "Developer" instead of "E2E Tester")
+        has_param = _PARAM_RE.search(full_output) is not None
+        assert has_param, \
+            f"Parameter substitution failed. Expected 'Developer', got: {full_output}"
+        assert len(full_output.strip()) > 50, \
+            f"Output seems too short, API call might have failed. Output: {full_output}"
+        
+        print(f"\n✅ Golden scenario completed successfully!")
+        print(f"Output length: {len(full_output)} characters")
+        print(f"Contains parameter: {'✓' if has_param else '❌'}")
             
     @pytest.mark.skipif(not GITHUB_TOKEN, reason="GITHUB_TOKEN required for E2E tests")        
-    def test_complete_golden_scenario_llm(self, temp_e2e_home, apm_binary):
+    @pytest.mark.slow
+    @pytest.mark.network
+    @pytest.mark.xdist_group("llm")
+    def test_complete_golden_scenario_llm(self, temp_e2e_home, e2e_env, apm_binary, llm_runtime, reference_project, tmp_path):
         """Test the complete golden scenario using LLM runtime."""
         
-        # Step 1: Setup LLM runtime (equivalent to: apm runtime setup llm)
-        print("\\n=== Setting up LLM runtime ===")
-        result = run_command(f"{apm_binary} runtime setup llm", timeout=300)
-        assert result.returncode == 0, f"LLM runtime setup failed: {result.stderr}"
-        
-        # Verify LLM is available
-        llm_wrapper = Path(temp_e2e_home) / ".apm" / "runtimes" / "llm"
-        assert llm_wrapper.exists(), "LLM wrapper not installed"
+        # Step 1: Setup LLM runtime (equivalent to: apm runtime setup llm),
+        # installed once per session by the llm_runtime fixture
+        assert llm_runtime.exists(), "LLM wrapper not installed"
         
         # Configure LLM for GitHub Models
         print("\\n=== Configuring LLM for GitHub Models ===")
         # LLM expects GITHUB_MODELS_KEY environment variable, not GITHUB_TOKEN
-        # Set it for the LLM runtime
-        os.environ['GITHUB_MODELS_KEY'] = GITHUB_TOKEN
+        # Set it for the LLM runtime, without touching the environment of other tests
+        env = {**e2e_env, 'GITHUB_MODELS_KEY': GITHUB_TOKEN}
         print("✓ Set GITHUB_MODELS_KEY environment variable for LLM")
         
         # Step 2: Use existing project or create new one
-        with tempfile.TemporaryDirectory() as project_workspace:
-            project_dir = Path(project_workspace) / "my-ai-native-project-llm"
-            
-            print("\\n=== Initializing LLM test project ===")
-            result = run_command(f"{apm_binary} init my-ai-native-project-llm --yes", cwd=project_workspace)
-            assert result.returncode == 0, f"Project init failed: {result.stderr}"
-            
-            # Step 3: Compile Agent Primitives
-            print("\\n=== Compiling Agent Primitives ===")
-            result = run_command(f"{apm_binary} compile", cwd=project_dir)
-            assert result.returncode == 0, f"Compilation failed: {result.stderr}"
-            
-            # Step 4: Install dependencies
-            result = run_command(f"{apm_binary} install", cwd=project_dir)
-            assert result.returncode == 0, f"Dependency install failed: {result.stderr}"
-            
-            # Step 5: Run with LLM runtime (equivalent to: apm run start --param name="Developer")
-            print("\\n=== Running golden scenario with LLM ===")
-            
-            # Ensure GITHUB_MODELS_KEY is set for the execution
-            env = os.environ.copy()
-            env['GITHUB_MODELS_KEY'] = GITHUB_TOKEN
-            env['HOME'] = temp_e2e_home
-            
-            # Run the command with proper environment (using correct parameter)
-            cmd = f'{apm_binary} run start --param name="Developer"'
-            process = subprocess.Popen(
-                cmd,
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                cwd=project_dir,
-                env=env
-            )
-            
-            output_lines = []
-            for line in iter(process.stdout.readline, ''):
-                if line:
-                    print(line.rstrip())
-                    output_lines.append(line)
-            
-            return_code = process.wait(timeout=120)
-            full_output = ''.join(output_lines)
-            
-            # Verify execution (LLM might have different authentication requirements)
-            if return_code == 0:
-                output = full_output.lower()
-                assert "developer" in output, "Parameter substitution failed"
-                assert len(output.strip()) > 50, "Output seems too short"
-                print(f"\\n=== LLM scenario output ===\\n{full_output}")
-            else:
-                # LLM might fail due to auth setup in CI, log for debugging
-                print(f"\\n=== LLM execution failed (expected in CI) ===")
-                print(f"Output: {full_output}")
-                pytest.skip("LLM execution failed, likely due to authentication in CI environment")
+        project_workspace = tmp_path
+        project_dir = Path(project_workspace) / "my-ai-native-project-llm"
+        
+        # Initialized and installed once by the reference_project fixture
+        print("\\n=== Initializing LLM test project ===")
+        copy_reference_project(reference_project, project_dir)
+        
+        # Step 3: Compile Agent Primitives
+        print("\\n=== Compiling Agent Primitives ===")
+        result = run_command([apm_binary, "compile"], cwd=project_dir, env=env)
+        assert result.returncode == 0, f"Compilation failed: {result.stderr}"
+        
+        # Step 4: Run with LLM runtime (equivalent to: apm run start --param name="Developer")
+        print("\\n=== Running golden scenario with LLM ===")
+        
+        # Run the command with proper environment (using correct parameter)
+        cmd = [apm_binary, "run", "start", "--param", "name=Developer"]
+        result = run_command(cmd, check=False, timeout=120, cwd=project_dir, show_output=True, env=env)
+        return_code, full_output = result.returncode, result.stdout
+        
+        # Verify execution (LLM might have different authentication requirements)
+        if return_code == 0:
+            assert _PARAM_RE.search(full_output), "Parameter substitution failed"
+            assert len(full_output.strip()) > 50, "Output seems too short"
+            print(f"\\n=== LLM scenario output ===\\n{full_output}")
+        else:
+            # LLM might fail due to auth setup in CI, log for debugging
+            print(f"\\n=== LLM execution failed (expected in CI) ===")
+            print(f"Output: {full_output}")
+            pytest.skip("LLM execution failed, likely due to authentication in CI environment")
+
+
+def _is_running(pid):
+    """Check whether a process is alive, counting zombies as gone."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+    except OSError:
+        # No procfs: fall back to signalling the process
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        return True
+
+
+@pytest.mark.skipif(not hasattr(os, "killpg"), reason="process groups are POSIX-only")
+class TestRunCommand:
+    """Tests for the command helpers the E2E scenarios rely on."""
+    
+    @pytest.mark.parametrize("show_output", [False, True])
+    def test_timeout_kills_background_children(self, show_output):
+        """Test a timeout kills children that outlive the command and hold its output open."""
+        cmd = ["sh", "-c", "sleep 41 & echo $!; exit 0"]
+        
+        with pytest.raises(pytest.fail.Exception, match="timed out") as excinfo:
+            run_command(cmd, timeout=2, show_output=show_output)
+        
+        child_pid = int(re.search(r"Partial output:\n(\d+)", str(excinfo.value)).group(1))
+        for _ in range(50):
+            if not _is_running(child_pid):
+                break
+            time.sleep(0.1)
+        assert not _is_running(child_pid), "Background child survived the timeout"
 
-    def test_runtime_list_command(self, temp_e2e_home, apm_binary):
+
+class TestApmCli:
+    """CLI checks from the quick start that need neither network access nor a runtime.
+    
+    These run without APM_E2E_TESTS, so every test run covers them.
+    """
+    
+    def test_runtime_list_command(self, apm_smoke_outputs):
         """Test that APM can list installed runtimes."""
         print("\\n=== Testing runtime list command ===")
-        result = run_command(f"{apm_binary} runtime list")
+        result = apm_smoke_outputs["runtime_list"]
         
         # Should succeed even if no runtimes installed
-        assert result.returncode == 0, f"Runtime list failed: {result.stderr}"
+        assert result.exit_code == 0, f"Runtime list failed: {result.output}"
         
         # Output should contain some indication of runtime status
-        output = result.stdout.lower()
+        output = result.output.lower()
         assert "runtime" in output or "codex" in output or "llm" in output or "no runtimes" in output, \
             "Runtime list output doesn't look correct"
         
-        print(f"Runtime list output: {result.stdout}")
+        print(f"Runtime list output: {result.output}")
 
-    def test_apm_version_and_help(self, apm_binary):
+    def test_apm_version_and_help(self, apm_smoke_outputs):
         """Test basic APM CLI functionality."""
         print("\\n=== Testing APM CLI basics ===")
         
         # Test version
-        result = run_command(f"{apm_binary} --version")
-        assert result.returncode == 0, f"Version command failed: {result.stderr}"
-        assert result.stdout.strip(), "Version output is empty"
+        result = apm_smoke_outputs["version"]
+        assert result.exit_code == 0, f"Version command failed: {result.output}"
+        assert result.output.strip(), "Version output is empty"
+        
+        print(f"APM version: {result.output}")
         
         # Test help
-        result = run_command(f"{apm_binary} --help")
-        assert result.returncode == 0, f"Help command failed: {result.stderr}"
-        assert "usage:" in result.stdout.lower() or "apm" in result.stdout.lower(), \
+        result = apm_smoke_outputs["help"]
+        assert result.exit_code == 0, f"Help command failed: {result.output}"
+        assert "usage:" in result.output.lower() or "apm" in result.output.lower(), \
             "Help output doesn't look correct"
-        
-        print(f"APM version: {result.stdout}")
 
-    def test_init_command_template_bundling(self, temp_e2e_home, apm_binary):
+    def test_init_command_template_bundling(self, temp_e2e_home, e2e_env, apm_binary, tmp_path):
         """Dedicated test for apm init command and template bundling."""
         print("\\n=== Testing APM init command and template bundling ===")
         
-        with tempfile.TemporaryDirectory() as workspace:
-            project_dir = Path(workspace) / "template-test-project"
-            
-            # Test apm init
-            result = run_command(f"{apm_binary} init template-test-project --yes", cwd=workspace, show_output=True)
-            assert result.returncode == 0, f"APM init failed: {result.stderr}"
-            
-            # Verify basic project files
-            assert project_dir.exists(), "Project directory not created"
-            assert (project_dir / "apm.yml").exists(), "apm.yml not created"
-            assert (project_dir / "hello-world.prompt.md").exists(), "Prompt template not created"
-            
-            # Critical: Verify Agent Primitives directory and files
-            apm_dir = project_dir / ".apm"
-            assert apm_dir.exists(), "Agent Primitives directory (.apm) not created - TEMPLATE BUNDLING FAILED"
-            
-            print(f"✅ Template bundling test passed: Agent Primitives directory (.apm) verified")
+        workspace = tmp_path
+        project_dir = Path(workspace) / "template-test-project"
+        
+        # Test apm init
+        result = run_command([apm_binary, "init", "template-test-project", "--yes"], cwd=workspace, show_output=True, env=e2e_env)
+        assert result.returncode == 0, f"APM init failed: {result.stderr}"
+        
+        # Verify basic project files
+        assert project_dir.exists(), "Project directory not created"
+        assert (project_dir / "apm.yml").exists(), "apm.yml not created"
+        assert (project_dir / "hello-world.prompt.md").exists(), "Prompt template not created"
+        
+        # Critical: Verify Agent Primitives directory and files
+        apm_dir = project_dir / ".apm"
+        assert apm_dir.exists(), "Agent Primitives directory (.apm) not created - TEMPLATE BUNDLING FAILED"
+        
+        print(f"✅ Template bundling test passed: Agent Primitives directory (.apm) verified")
 
 
+@requires_e2e
 class TestRuntimeInteroperability:
     """Test that both runtimes can be installed and work together."""
     
-    def test_dual_runtime_installation(self, temp_e2e_home, apm_binary):
+    @pytest.mark.slow
+    @pytest.mark.network
+    def test_dual_runtime_installation(self, temp_e2e_home, installed_runtimes, cli_runner, apm_cli):
         """Test installing both runtimes in the same environment."""
         
-        # Install Codex
-        print("\\n=== Installing Codex runtime ===")
-        result = run_command(f"{apm_binary} runtime setup codex", timeout=300)
-        assert result.returncode == 0, f"Codex setup failed: {result.stderr}"
-        
-        # Install LLM  
-        print("\\n=== Installing LLM runtime ===")
-        result = run_command(f"{apm_binary} runtime setup llm", timeout=300)
-        assert result.returncode == 0, f"LLM setup failed: {result.stderr}"
-        
-        # Verify both are available
-        runtime_dir = Path(temp_e2e_home) / ".apm" / "runtimes"
-        assert (runtime_dir / "codex").exists(), "Codex not found after dual install"
-        assert (runtime_dir / "llm").exists(), "LLM not found after dual install"
+        # Both runtimes are installed by the session fixtures; verify both are available
+        assert installed_runtimes["codex"].exists(), "Codex not found after dual install"
+        assert installed_runtimes["llm"].exists(), "LLM not found after dual install"
         
         # Test runtime list shows both
-        result = run_command(f"{apm_binary} runtime list")
-        assert result.returncode == 0, f"Runtime list failed: {result.stderr}"
+        result = cli_runner.invoke(apm_cli, ["runtime", "list"], env={"HOME": temp_e2e_home})
+        assert result.exit_code == 0, f"Runtime list failed: {result.output}"
         
-        output = result.stdout.lower()
         # Should show both runtimes (exact format may vary)
-        print(f"Runtime list with both installed: {result.stdout}")
+        print(f"Runtime list with both installed: {result.output}")
 
 
 if __name__ == "__main__":
@@ -478,10 +574,10 @@ if __name__ == "__main__":
     print("To run E2E tests manually:")
     print("export APM_E2E_TESTS=1")
     print("export GITHUB_TOKEN=your_token_here")  
-    print("pytest tests/integration/test_golden_scenario_e2e.py -v -s")
+    print("pytest tests/integration/test_golden_scenario_e2e.py -v -n 2 --dist loadgroup -p no:cacheprovider")
     
     # Run tests when executed directly
     if E2E_MODE:
-        pytest.main([__file__, "-v", "-s"])
+        pytest.main([__file__, "-v", "-s", "-p", "no:cacheprovider"])
     else:
         print("\\nE2E mode not enabled. Set APM_E2E_TESTS=1 to run these tests.")
@@ -4,33 +4,9 @@ import os
 import json
 import tempfile
 import unittest
-import time
-import shutil
-import gc
-import sys
-from unittest.mock import patch, MagicMock
-from apm_cli.factory import ClientFactory, PackageManagerFactory
+from unittest.mock import patch
 from apm_cli.core.operations import install_package
-
-
-def safe_rmdir(path):
-    """Safely remove a directory with retry logic for Windows.
-    
-    Args:
-        path (str): Path to directory to remove
-    """
-    try:
-        shutil.rmtree(path)
-    except PermissionError:
-        # On Windows, give time for any lingering processes to release the lock
-        time.sleep(0.5)
-        gc.collect()  # Force garbage collection to release file handles
-        try:
-            shutil.rmtree(path)
-        except PermissionError as e:
-            print(f"Failed to remove directory {path}: {e}")
-            # Continue without failing the test
-            pass
+from apm_cli.utils import json_io
 
 
 class TestIntegration(unittest.TestCase):
@@ -38,31 +14,16 @@ class TestIntegration(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures."""
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.temp_dir_path = self.temp_dir.name
-        self.temp_path = os.path.join(self.temp_dir_path, "settings.json")
+        # The VS Code adapter closes the settings file after every read and
+        # write, so the directory can be removed without waiting for handles
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_path = os.path.join(temp_dir.name, "settings.json")
         
         # Create a temporary settings file
         with open(self.temp_path, "w") as f:
             json.dump({}, f)
     
-    def tearDown(self):
-        """Tear down test fixtures."""
-        # Force garbage collection to release file handles
-        gc.collect()
-        
-        # Give time for Windows to release locks
-        if sys.platform == 'win32':
-            time.sleep(0.1)
-            
-        # First, try the standard cleanup
-        try:
-            self.temp_dir.cleanup()
-        except PermissionError:
-            # If standard cleanup fails on Windows, use our safe_rmdir function
-            if hasattr(self, 'temp_dir_path') and os.path.exists(self.temp_dir_path):
-                safe_rmdir(self.temp_dir_path)
-    
     @patch("apm_cli.adapters.client.vscode.VSCodeClientAdapter.get_config_path")
     @patch("apm_cli.registry.client.SimpleRegistryClient.find_server_by_reference")
     def test_install_package_integration(self, mock_find_server, mock_get_path):
@@ -86,8 +47,8 @@ class TestIntegration(unittest.TestCase):
         self.assertTrue(result)
         
         # Verify the client configuration was updated
-        with open(self.temp_path, "r") as f:
-            config = json.load(f)
+        with open(self.temp_path, "rb") as f:
+            config = json_io.loads(f.read())
         
         # Should have servers entry and should NOT have the deprecated mcp.package entry
         self.assertIn("servers", config)
@@ -2,6 +2,7 @@
 
 import tempfile
 import os
+import pytest
 from unittest.mock import patch, Mock
 from apm_cli.workflow.runner import run_workflow
 from apm_cli.runtime.factory import RuntimeFactory
@@ -87,24 +88,38 @@ ${input:message}
             assert "Unknown runtime: unknown" in result
 
 
-def test_runtime_factory_integration():
-    """Test runtime factory integration on real system."""
-    # Test getting available runtimes
-    available = RuntimeFactory.get_available_runtimes()
+@pytest.fixture(scope="module")
+def factory_state():
+    """Runtime discovery results on the real system, computed once per module."""
+    return {
+        "available": RuntimeFactory.get_available_runtimes(),
+        "best": RuntimeFactory.get_best_available_runtime(),
+    }
+
+
+def test_runtime_factory_available_runtimes(factory_state):
+    """Test runtime factory discovery on real system."""
+    available = factory_state["available"]
     
     # Should have at least LLM available
     assert len(available) >= 1
     assert any(rt["name"] == "llm" for rt in available)
-    
-    # Test runtime existence checks
-    assert RuntimeFactory.runtime_exists("llm") is True
-    assert RuntimeFactory.runtime_exists("unknown") is False
-    
-    # Test getting best available runtime
-    best_runtime = RuntimeFactory.get_best_available_runtime()
+
+
+@pytest.mark.parametrize("name,expected", [("llm", True), ("unknown", False)])
+def test_runtime_factory_runtime_exists(name, expected):
+    """Test runtime existence checks on real system."""
+    assert RuntimeFactory.runtime_exists(name) is expected
+
+
+def test_runtime_factory_best_available_runtime(factory_state):
+    """Test getting the best available runtime on real system."""
+    best_runtime = factory_state["best"]
     assert best_runtime is not None
     assert best_runtime.get_runtime_name() in ["llm", "codex"]
-    
-    # Test creating specific runtime
+
+
+def test_runtime_factory_create_runtime():
+    """Test creating a specific runtime on real system."""
     llm_runtime = RuntimeFactory.create_runtime("llm")
-    assert llm_runtime.get_runtime_name() == "llm"
\ No newline at end of file
+    assert llm_runtime.get_runtime_name() == "llm"
@@ -1,80 +1,46 @@
 """Integration tests for MCP registry client."""
 
-import os
-import json
 import pytest
-import tempfile
-import time
-import shutil
-import gc
-import sys
-from pathlib import Path
 from apm_cli.registry.client import SimpleRegistryClient
 from apm_cli.adapters.client.vscode import VSCodeClientAdapter
+from apm_cli.utils import json_io
 
 
-def safe_rmdir(path):
-    """Safely remove a directory with retry logic for Windows.
-    
-    Args:
-        path (str): Path to directory to remove
-    """
-    try:
-        shutil.rmtree(path)
-    except PermissionError:
-        # On Windows, give time for any lingering processes to release the lock
-        time.sleep(0.5)
-        gc.collect()  # Force garbage collection to release file handles
-        try:
-            shutil.rmtree(path)
-        except PermissionError as e:
-            print(f"Failed to remove directory {path}: {e}")
-            # Continue without failing the test
-            pass
+@pytest.fixture(scope="class")
+def workspace(tmp_path_factory):
+    """Temporary directory with a .vscode directory, shared by a test class."""
+    path = tmp_path_factory.mktemp("vscode")
+    (path / ".vscode").mkdir()
+    return path
 
 
 class TestMCPRegistry:
     """Test the MCP registry client with the demo registry."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def registry_env(self, registry_client, server_listing, workspace, monkeypatch):
         """Set up test environment."""
-        self.registry_client = SimpleRegistryClient("https://demo.registry.azure-mcp.net")
-        
-        # Create a temporary directory for tests
-        self.test_dir = tempfile.TemporaryDirectory()
-        self.test_dir_path = self.test_dir.name
-        os.chdir(self.test_dir_path)
-        
-        # Create .vscode directory
-        os.makedirs(os.path.join(self.test_dir_path, ".vscode"), exist_ok=True)
-    
-    def teardown_method(self):
-        """Clean up after tests."""
-        # Force garbage collection to release file handles
-        gc.collect()
+        self.registry_client = registry_client
+        self.servers = server_listing
+        # Registry clients created by the adapters reuse the session fixture's
+        # HTTP session, which answers from the canned registry by default
+        monkeypatch.setitem(SimpleRegistryClient._sessions, registry_client.registry_url, registry_client.session)
         
-        # Give time for Windows to release locks
-        if sys.platform == 'win32':
-            time.sleep(0.1)
-            
-        # First, try the standard cleanup
-        try:
-            self.test_dir.cleanup()
-        except PermissionError:
-            # If standard cleanup fails on Windows, use our safe_rmdir function
-            if hasattr(self, 'test_dir_path') and os.path.exists(self.test_dir_path):
-                safe_rmdir(self.test_dir_path)
+        # Work in the class's directory, without the configuration an earlier test wrote
+        self.config_path = workspace / ".vscode" / "mcp.json"
+        monkeypatch.chdir(workspace)
+        self.config_path.unlink(missing_ok=True)
     
     def test_list_servers(self):
         """Test listing servers from the registry."""
-        servers, _ = self.registry_client.list_servers()
+        servers = self.servers
         assert isinstance(servers, list), "Server list should be a list"
         assert len(servers) > 0, "Demo registry should have some servers"
     
     def test_get_server_info(self):
         """Test getting server details for a specific server."""
         # Get the first server from the list
-        servers, _ = self.registry_client.list_servers()
+        servers = self.servers
         if not servers:
             pytest.skip("No servers available in the demo registry")
         
@@ -91,7 +57,7 @@ class TestMCPRegistry:
         adapter = VSCodeClientAdapter("https://demo.registry.azure-mcp.net")
         
         # Get a list of servers
-        servers, _ = self.registry_client.list_servers()
+        servers = self.servers
         if not servers:
             pytest.skip("No servers available in the demo registry")
         
@@ -102,11 +68,9 @@ class TestMCPRegistry:
         assert result is True, f"Should be able to configure server {server_id}"
         
         # Check the generated configuration file
-        config_path = os.path.join(self.test_dir.name, ".vscode", "mcp.json")
-        assert os.path.exists(config_path), "Configuration file should be created"
+        assert self.config_path.exists(), "Configuration file should be created"
         
-        with open(config_path, "r", encoding="utf-8") as f:
-            config = json.load(f)
+        config = json_io.loads(self.config_path.read_bytes())
         
         assert "servers" in config, "Config should have servers section"
         
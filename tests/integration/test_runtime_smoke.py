@@ -16,21 +16,14 @@ from pathlib import Path
 @pytest.fixture(scope="module")
 def temp_apm_home():
     """Create a temporary APM home directory for testing."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        original_home = os.environ.get('HOME')
+    with tempfile.TemporaryDirectory() as temp_dir, pytest.MonkeyPatch.context() as mp:
         test_home = os.path.join(temp_dir, 'test_home')
         os.makedirs(test_home)
         
-        # Set up test environment
-        os.environ['HOME'] = test_home
+        # Set up test environment; the original HOME is restored on teardown
+        mp.setenv('HOME', test_home)
         
         yield test_home
-        
-        # Restore original environment
-        if original_home:
-            os.environ['HOME'] = original_home
-        else:
-            del os.environ['HOME']
 
 
 def run_command(cmd, check=True, capture_output=True, timeout=60, cwd=None):
@@ -153,7 +146,7 @@ class TestRuntimeSmoke:
         assert result.returncode == 0, f"LLM --help failed: {result.stderr}"
         assert "Usage:" in result.stdout or "usage:" in result.stdout, "Help output doesn't contain usage info"
     
-    def test_apm_runtime_detection(self, temp_apm_home):
+    def test_apm_runtime_detection(self, temp_apm_home, monkeypatch):
         """Test that APM can detect installed runtimes."""
         # Import APM modules
         from apm_cli.runtime.factory import RuntimeFactory
@@ -161,20 +154,14 @@ class TestRuntimeSmoke:
         # Update PATH to include our test runtime directory
         runtime_dir = Path(temp_apm_home) / ".apm" / "runtimes"
         if runtime_dir.exists():
-            original_path = os.environ.get('PATH', '')
-            os.environ['PATH'] = f"{runtime_dir}:{original_path}"
+            monkeypatch.setenv('PATH', str(runtime_dir), prepend=os.pathsep)
             
-            try:
-                # Test runtime detection
-                if (runtime_dir / "codex").exists():
-                    assert RuntimeFactory.runtime_exists("codex"), "APM cannot detect installed Codex runtime"
-                
-                if (runtime_dir / "llm").exists():
-                    assert RuntimeFactory.runtime_exists("llm"), "APM cannot detect installed LLM runtime"
-                    
-            finally:
-                # Restore PATH
-                os.environ['PATH'] = original_path
+            # Test runtime detection
+            if (runtime_dir / "codex").exists():
+                assert RuntimeFactory.runtime_exists("codex"), "APM cannot detect installed Codex runtime"
+            
+            if (runtime_dir / "llm").exists():
+                assert RuntimeFactory.runtime_exists("llm"), "APM cannot detect installed LLM runtime"
     
     def test_apm_workflow_compilation(self, temp_apm_home):
         """Test that APM can compile workflows without executing them."""
@@ -12,6 +12,7 @@ from apm_cli.compilation.template_builder import (
 )
 from apm_cli.compilation.link_resolver import (
     validate_link_targets,
+    _remove_frontmatter,
 )
 from apm_cli.compilation.agents_compiler import (
     AgentsCompiler,
@@ -66,6 +67,33 @@ class TestTemplateBuilder(unittest.TestCase):
         self.assertIn("Write comprehensive docstrings.", result)
         self.assertIn("Use ES6+ features and proper formatting.", result)
 
+    def test_build_conditional_sections_deduplicates_content(self):
+        """Test that identical content for the same pattern is emitted once."""
+        instructions = [
+            Instruction(
+                name=name,
+                file_path=Path(f"{name}.md"),
+                description="Shared instructions",
+                apply_to=apply_to,
+                content=content,
+            )
+            for name, apply_to, content in [
+                ("first", "**/*.py", "Follow PEP 8."),
+                ("copy", "**/*.py", "  Follow PEP 8.\n"),
+                ("other", "**/*.py", "Write docstrings."),
+                ("js", "**/*.js", "Follow PEP 8."),
+            ]
+        ]
+        
+        result = build_conditional_sections(instructions)
+        
+        # Duplicates are dropped per pattern, keeping the first source
+        self.assertEqual(result.count("Follow PEP 8."), 2)
+        self.assertIn("<!-- Source: first.md -->", result)
+        self.assertNotIn("<!-- Source: copy.md -->", result)
+        self.assertIn("<!-- Source: js.md -->", result)
+        self.assertLess(result.index("Follow PEP 8."), result.index("Write docstrings."))
+
     def test_build_conditional_sections_empty(self):
         """Test building conditional sections with no instructions."""
         result = build_conditional_sections([])
@@ -108,6 +136,17 @@ class TestLinkResolver(unittest.TestCase):
         self.assertEqual(len(errors), 1)
         self.assertIn("missing.md", errors[0])
 
+    def test_remove_frontmatter(self):
+        """Test stripping frontmatter up to the closing delimiter."""
+        content = "---\ndescription: Test\n  ---  \n# Body\n---\nMore"
+        self.assertEqual(_remove_frontmatter(content), "# Body\n---\nMore")
+        
+        # Content without frontmatter is returned stripped
+        self.assertEqual(_remove_frontmatter("\n# Body\n"), "# Body")
+        
+        # Unterminated frontmatter swallows the whole document
+        self.assertEqual(_remove_frontmatter("---\ndescription: Test\n"), "")
+
 
 class TestAgentsCompiler(unittest.TestCase):
     """Test main compilation functionality."""
@@ -8,6 +8,13 @@ from apm_cli.runtime.codex_runtime import CodexRuntime
 class TestCodexRuntime:
     """Test Codex runtime adapter."""
     
+    @pytest.fixture(autouse=True)
+    def reset_caches(self):
+        """Reset the process-wide Codex version cache around each test."""
+        CodexRuntime._version_cache = None
+        yield
+        CodexRuntime._version_cache = None
+    
     @patch('apm_cli.runtime.codex_runtime.shutil.which')
     def test_init_success(self, mock_which):
         """Test successful initialization."""
@@ -61,6 +68,33 @@ class TestCodexRuntime:
         with pytest.raises(RuntimeError, match="Codex execution failed"):
             runtime.execute_prompt("Test prompt")
     
+    @patch('apm_cli.runtime.codex_runtime.threading.Timer')
+    @patch('apm_cli.runtime.codex_runtime.subprocess.Popen')
+    @patch('apm_cli.runtime.codex_runtime.shutil.which')
+    def test_execute_prompt_timeout(self, mock_which, mock_popen, mock_timer):
+        """Test the watchdog kills a process that runs past the timeout."""
+        mock_which.return_value = "/usr/local/bin/codex"
+        
+        mock_process = Mock()
+        mock_process.stdout.readline.side_effect = [""]
+        mock_process.wait.return_value = -9  # Killed
+        mock_popen.return_value = mock_process
+        
+        # Fire the watchdog as soon as it is started
+        def timer(interval, function):
+            assert interval == 300
+            watchdog = Mock()
+            watchdog.start.side_effect = function
+            return watchdog
+        mock_timer.side_effect = timer
+        
+        runtime = CodexRuntime()
+        
+        with pytest.raises(RuntimeError, match="timed out after 5 minutes"):
+            runtime.execute_prompt("Test prompt")
+        
+        mock_process.kill.assert_called_once()
+    
     @patch('apm_cli.runtime.codex_runtime.shutil.which')
     def test_list_available_models(self, mock_which):
         """Test listing available models."""
@@ -106,6 +140,43 @@ class TestCodexRuntime:
         assert CodexRuntime.is_available() is False
         mock_which.assert_called_once_with("codex")
     
+    @patch('apm_cli.runtime.codex_runtime.subprocess.run')
+    @patch('apm_cli.runtime.codex_runtime.shutil.which')
+    def test_version_probe_is_cached(self, mock_which, mock_run):
+        """Test the version probe runs once per process."""
+        mock_which.return_value = "/usr/local/bin/codex"
+        mock_run.return_value = Mock(returncode=0, stdout="1.0.0")
+        
+        runtime = CodexRuntime()
+        assert runtime.get_runtime_info()["version"] == "1.0.0"
+        assert CodexRuntime().get_runtime_info()["version"] == "1.0.0"
+        
+        mock_run.assert_called_once()
+    
+    @patch('apm_cli.runtime.codex_runtime.shutil.which')
+    def test_is_available_after_install(self, mock_which):
+        """Test a Codex installed after an unsuccessful probe is detected."""
+        mock_which.side_effect = [None, "/usr/local/bin/codex"]
+        
+        assert CodexRuntime.is_available() is False
+        assert CodexRuntime.is_available() is True
+    
+    @patch('apm_cli.runtime.codex_runtime.subprocess.run')
+    @patch('apm_cli.runtime.codex_runtime.shutil.which')
+    def test_get_runtime_info_returns_copies(self, mock_which, mock_run):
+        """Test mutating returned runtime info does not leak into later calls."""
+        mock_which.return_value = "/usr/local/bin/codex"
+        mock_run.return_value = Mock(returncode=0, stdout="1.0.0")
+        
+        runtime = CodexRuntime()
+        info = runtime.get_runtime_info()
+        info["available"] = True
+        info["capabilities"]["mcp_servers"] = "changed"
+        
+        fresh = runtime.get_runtime_info()
+        assert "available" not in fresh
+        assert fresh["capabilities"]["mcp_servers"] == "native_support"
+    
     def test_get_runtime_name(self):
         """Test runtime name getter."""
         assert CodexRuntime.get_runtime_name() == "codex"
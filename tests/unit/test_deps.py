@@ -104,6 +104,18 @@ class TestDependenciesVerifier(unittest.TestCase):
         config = load_apm_config('nonexistent.yml')
         self.assertIsNone(config)
     
+    def test_load_apm_config_cache_invalidation(self):
+        """Test that the cached configuration is refreshed when the file changes."""
+        first = load_apm_config(self.config_path)
+        self.assertIs(load_apm_config(self.config_path), first)
+        
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            yaml.dump({'version': '2.0', 'servers': ['server4']}, f)
+        
+        config = load_apm_config(self.config_path)
+        self.assertEqual(config['version'], '2.0')
+        self.assertEqual(config['servers'], ['server4'])
+    
     @patch('apm_cli.factory.PackageManagerFactory.create_package_manager')
     def test_verify_dependencies(self, mock_factory):
         """Test verifying dependencies."""
@@ -128,21 +140,15 @@ class TestDependenciesVerifier(unittest.TestCase):
         self.assertEqual(missing, [])
     
     @patch('apm_cli.factory.ClientFactory.create_client')
-    @patch('apm_cli.factory.PackageManagerFactory.create_package_manager')
     @patch('apm_cli.deps.verifier.verify_dependencies')
-    def test_install_missing_dependencies(self, mock_verify, mock_factory, mock_client_factory):
+    def test_install_missing_dependencies(self, mock_verify, mock_client_factory):
         """Test installing missing dependencies."""
         # Mock verify_dependencies to return missing packages
         mock_verify.return_value = (False, ['server1'], ['server2', 'server3'])
         
-        # Mock the package manager to install packages
-        mock_package_manager = unittest.mock.MagicMock()
-        mock_package_manager.install.return_value = True
-        mock_factory.return_value = mock_package_manager
-        
         # Mock the client adapter
         mock_client = unittest.mock.MagicMock()
-        mock_client.configure_mcp_server.return_value = True
+        mock_client.configure_mcp_servers.return_value = ['server2', 'server3']
         mock_client_factory.return_value = mock_client
         
         # Call the function
@@ -152,12 +158,16 @@ class TestDependenciesVerifier(unittest.TestCase):
         self.assertTrue(success)
         self.assertEqual(set(installed), {'server2', 'server3'})
         self.assertEqual(mock_verify.call_count, 1)
-        self.assertEqual(mock_package_manager.install.call_count, 2)
-        self.assertEqual(mock_client.configure_mcp_server.call_count, 2)
         
-        # Verify client was configured properly
-        mock_client.configure_mcp_server.assert_any_call('server2', server_name='server2')
-        mock_client.configure_mcp_server.assert_any_call('server3', server_name='server3')
+        # Verify all missing servers were configured in a single batch
+        mock_client_factory.assert_called_once_with("vscode")
+        mock_client.configure_mcp_servers.assert_called_once_with(['server2', 'server3'])
+        
+        # Partial installs are reported as a failure
+        mock_client.configure_mcp_servers.return_value = ['server2']
+        success, installed = install_missing_dependencies(self.config_path, "vscode")
+        self.assertFalse(success)
+        self.assertEqual(installed, ['server2'])
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@
 
 import unittest
 import sys
+from unittest.mock import patch
 from apm_cli.utils.helpers import is_tool_available, detect_platform, get_available_package_managers
 
 
@@ -25,6 +26,17 @@ class TestHelpers(unittest.TestCase):
         # Test a command that almost certainly doesn't exist
         self.assertFalse(is_tool_available('this_command_does_not_exist_12345'))
     
+    @patch('apm_cli.utils.helpers._available_tools', set())
+    @patch('apm_cli.utils.helpers.shutil.which')
+    def test_is_tool_available_caches_only_found_tools(self, mock_which):
+        """Test a missing tool is looked up again, while a found one is cached."""
+        mock_which.side_effect = [None, "/usr/local/bin/cached-tool-12345"]
+        
+        self.assertFalse(is_tool_available('cached-tool-12345'))
+        self.assertTrue(is_tool_available('cached-tool-12345'))
+        self.assertTrue(is_tool_available('cached-tool-12345'))
+        self.assertEqual(mock_which.call_count, 2)
+    
     def test_detect_platform(self):
         """Test detect_platform function."""
         platform = detect_platform()
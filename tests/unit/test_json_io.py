@@ -0,0 +1,52 @@
+"""Tests for JSON serialization helpers."""
+
+import json
+import unittest
+from unittest.mock import patch
+from apm_cli.utils import json_io
+
+
+class TestJsonIO(unittest.TestCase):
+    """Test cases for JSON serialization helpers."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.config = {
+            "servers": {
+                "fetch": {
+                    "type": "stdio",
+                    "command": "npx",
+                    "args": ["@mcp/fetch"],
+                    "env": {"API_KEY": "${input:api-key}"}
+                },
+                "empty": {}
+            },
+            "inputs": [],
+            "description": "Café"
+        }
+
+    def test_dumps_matches_stdlib_layout(self):
+        """Test output is the two-space indented stdlib layout."""
+        expected = json.dumps(self.config, indent=2, ensure_ascii=False)
+
+        self.assertEqual(json_io.dumps(self.config), expected)
+        with patch.object(json_io, "orjson", None):
+            self.assertEqual(json_io.dumps(self.config), expected)
+
+    def test_loads_bytes(self):
+        """Test decoding UTF-8 bytes with and without orjson."""
+        raw = json.dumps(self.config, ensure_ascii=False).encode("utf-8")
+
+        self.assertEqual(json_io.loads(raw), self.config)
+        with patch.object(json_io, "orjson", None):
+            self.assertEqual(json_io.loads(raw), self.config)
+            with self.assertRaises(json.JSONDecodeError):
+                json_io.loads(b"{")
+
+    def test_dumps_non_string_keys(self):
+        """Test objects orjson cannot encode fall back to the stdlib."""
+        self.assertEqual(json.loads(json_io.dumps({1: "one"})), {"1": "one"})
+
+
+if __name__ == "__main__":
+    unittest.main()
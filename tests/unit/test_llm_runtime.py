@@ -1,5 +1,6 @@
 """Test LLM runtime integration."""
 
+import subprocess
 import pytest
 from unittest.mock import Mock, patch
 from apm_cli.runtime.llm_runtime import LLMRuntime
@@ -18,7 +19,7 @@ class TestLLMRuntime:
         
         assert runtime.model_name == "gpt-4o-mini"
         mock_run.assert_called_once_with(['llm', '--version'], 
-                                        capture_output=True, text=True, check=True)
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
     
     @patch('apm_cli.runtime.llm_runtime.subprocess.run')
     def test_init_fallback(self, mock_run):
@@ -66,6 +67,18 @@ class TestLLMRuntime:
         with pytest.raises(RuntimeError, match="Failed to execute prompt"):
             runtime.execute_prompt("Test prompt")
     
+    @patch('apm_cli.runtime.llm_runtime.subprocess.run')
+    @patch('apm_cli.runtime.llm_runtime.shutil.which')
+    def test_is_available_checks_path_only(self, mock_which, mock_run):
+        """Test availability is a PATH lookup that never launches llm."""
+        mock_which.return_value = "/usr/bin/llm"
+        assert LLMRuntime.is_available() is True
+        
+        mock_which.return_value = None
+        assert LLMRuntime.is_available() is False
+        
+        mock_run.assert_not_called()
+    
     def test_get_default_model(self):
         """Test default model getter."""
         assert LLMRuntime.get_default_model() is None
@@ -1,7 +1,9 @@
 """Unit tests for the MCP registry client."""
 
+import json
 import unittest
 import os
+import requests
 from unittest import mock
 from apm_cli.registry.client import SimpleRegistryClient
 
@@ -36,6 +38,7 @@ class TestSimpleRegistryClient(unittest.TestCase):
                 "count": 2
             }
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
         
@@ -55,6 +58,7 @@ class TestSimpleRegistryClient(unittest.TestCase):
         # Mock response
         mock_response = mock.Mock()
         mock_response.json.return_value = {"servers": [], "metadata": {}}
+        mock_response.content = b'{"servers": [], "metadata": {}}'
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
         
@@ -92,6 +96,9 @@ class TestSimpleRegistryClient(unittest.TestCase):
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0]["name"], "server2")
         
+        # The listing is fetched once and reused by later searches
+        mock_list_servers.assert_called_once()
+        
     @mock.patch('requests.Session.get')
     def test_get_server_info(self, mock_get):
         """Test getting server information from the registry."""
@@ -122,6 +129,7 @@ class TestSimpleRegistryClient(unittest.TestCase):
             ]
         }
         mock_response.json.return_value = server_data
+        mock_response.content = json.dumps(server_data).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
         
@@ -174,6 +182,28 @@ class TestSimpleRegistryClient(unittest.TestCase):
         result = self.client.get_server_by_name("non-existent")
         self.assertIsNone(result)
         
+    @mock.patch('apm_cli.registry.client.SimpleRegistryClient.get_server_info')
+    @mock.patch('apm_cli.registry.client.SimpleRegistryClient.list_servers')
+    def test_name_lookups_share_server_listing(self, mock_list_servers, mock_get_server_info):
+        """Test that name lookups reuse one server listing until refresh."""
+        mock_list_servers.return_value = (
+            [
+                {"id": "1", "name": "server1"},
+                {"id": "2", "name": "server2"}
+            ],
+            None
+        )
+        mock_get_server_info.side_effect = lambda server_id: {"id": server_id}
+        
+        self.assertEqual(self.client.get_server_by_name("server1"), {"id": "1"})
+        self.assertEqual(self.client.find_server_by_reference("server2"), {"id": "2"})
+        self.assertIsNone(self.client.get_server_by_name("missing"))
+        mock_list_servers.assert_called_once()
+        
+        self.client.refresh()
+        self.client.get_server_by_name("server1")
+        self.assertEqual(mock_list_servers.call_count, 2)
+        
     @mock.patch.dict(os.environ, {"MCP_REGISTRY_URL": "https://custom-registry.example.com"})
     def test_environment_variable_override(self):
         """Test overriding the registry URL with an environment variable."""
@@ -184,6 +214,28 @@ class TestSimpleRegistryClient(unittest.TestCase):
         client = SimpleRegistryClient("https://explicit-url.example.com")
         self.assertEqual(client.registry_url, "https://explicit-url.example.com")
 
+    @mock.patch('apm_cli.utils.json_io.orjson', None)
+    @mock.patch('requests.Session.get')
+    def test_get_server_info_without_orjson(self, mock_get):
+        """Test decoding registry responses with the standard library fallback."""
+        mock_response = mock.Mock()
+        mock_response.content = '{"id": "1", "name": "caf\u00e9"}'.encode("utf-8")
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+        
+        server_info = self.client.get_server_info("1")
+        
+        self.assertEqual(server_info, {"id": "1", "name": "caf\u00e9"})
+
+    def test_session_shared_per_registry(self):
+        """Test that clients of the same registry share one HTTP session."""
+        client = SimpleRegistryClient(self.client.registry_url)
+        other = SimpleRegistryClient("https://other-registry.example.com")
+        
+        self.assertIs(client.session, self.client.session)
+        self.assertIsNot(other.session, self.client.session)
+        self.assertEqual(client.session.get_adapter(client.registry_url)._pool_maxsize, 10)
+
     @mock.patch('apm_cli.registry.client.SimpleRegistryClient.get_server_info')
     def test_find_server_by_reference_uuid(self, mock_get_server_info):
         """Test finding a server by UUID reference."""
@@ -301,6 +353,38 @@ class TestSimpleRegistryClient(unittest.TestCase):
         mock_list_servers.assert_called_once()
         mock_get_server_info.assert_called_once_with("123e4567-e89b-12d3-a456-426614174000")
 
+    @mock.patch('apm_cli.registry.client.SimpleRegistryClient.find_server_by_reference')
+    def test_find_servers_by_reference(self, mock_find):
+        """Test resolving several references at once."""
+        servers = {"fetch": {"id": "1", "name": "fetch"}, "github": {"id": "2", "name": "github"}}
+        
+        def find(reference):
+            if reference == "broken":
+                raise Exception("Network error")
+            return servers.get(reference)
+        
+        mock_find.side_effect = find
+        
+        result = self.client.find_servers_by_reference(["fetch", "missing", "broken", "github"])
+        
+        self.assertEqual(list(result), ["fetch", "missing", "broken", "github"])
+        self.assertEqual(result["fetch"], servers["fetch"])
+        self.assertEqual(result["github"], servers["github"])
+        self.assertIsNone(result["missing"])
+        self.assertIsInstance(result["broken"], Exception)
+        self.assertEqual(str(result["broken"]), "Network error")
+        self.assertEqual(self.client.find_servers_by_reference([]), {})
+
+    @mock.patch('apm_cli.registry.client.SimpleRegistryClient.find_server_by_reference')
+    def test_find_servers_by_reference_connection_error(self, mock_find):
+        """Test a registry connection error is returned rather than reported as not found."""
+        error = requests.ConnectionError("Registry unreachable")
+        mock_find.side_effect = error
+        
+        result = self.client.find_servers_by_reference(["fetch"])
+        
+        self.assertIs(result["fetch"], error)
+
     @mock.patch('apm_cli.registry.client.SimpleRegistryClient.list_servers')
     def test_find_server_by_reference_invalid_format(self, mock_list_servers):
         """Test finding a server with various invalid/edge case formats."""
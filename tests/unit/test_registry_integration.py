@@ -138,6 +138,21 @@ class TestRegistryIntegration(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.integration.get_package_info("non-existent")
             
+    @mock.patch('apm_cli.registry.client.SimpleRegistryClient.get_server_info')
+    def test_get_package_info_cached(self, mock_get_server_info):
+        """Test that package details are fetched once until the cache is invalidated."""
+        mock_get_server_info.return_value = {"id": "123", "name": "test-server"}
+        
+        first = self.integration.get_package_info("123")
+        second = self.integration.get_package_info("123")
+        
+        self.assertIs(first, second)
+        mock_get_server_info.assert_called_once_with("123")
+        
+        self.integration.invalidate_cache()
+        self.integration.get_package_info("123")
+        self.assertEqual(mock_get_server_info.call_count, 2)
+        
     @mock.patch('apm_cli.registry.integration.RegistryIntegration.get_package_info')
     def test_get_latest_version(self, mock_get_package_info):
         """Test getting the latest version of a package."""
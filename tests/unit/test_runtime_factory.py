@@ -60,6 +60,18 @@ class TestRuntimeFactory:
         """Test runtime exists check - false."""
         assert RuntimeFactory.runtime_exists("unknown") is False
     
+    @patch('apm_cli.runtime.llm_runtime.LLMRuntime.__init__')
+    @patch('apm_cli.runtime.llm_runtime.LLMRuntime.is_available')
+    def test_runtime_exists_does_not_create_runtime(self, mock_available, mock_init):
+        """Test runtime exists check only probes availability."""
+        mock_available.return_value = True
+        
+        assert RuntimeFactory.runtime_exists("llm") is True
+        mock_init.assert_not_called()
+        
+        mock_available.return_value = False
+        assert RuntimeFactory.runtime_exists("llm") is False
+    
     def test_runtime_exists_codex_depends_on_system(self):
         """Test runtime exists check for Codex - depends on system."""
         # Codex availability depends on whether it's installed
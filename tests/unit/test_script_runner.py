@@ -107,6 +107,12 @@ class TestPromptCompiler:
         """Set up test fixtures."""
         self.compiler = PromptCompiler()
     
+    def test_compiled_filename(self):
+        """Test that only the trailing .prompt suffix is stripped."""
+        assert PromptCompiler.compiled_filename("hello-world.prompt.md") == "hello-world.txt"
+        assert PromptCompiler.compiled_filename("prompts/my.prompter.prompt.md") == "my.prompter.txt"
+        assert PromptCompiler.compiled_filename("notes.md") == "notes.txt"
+    
     def test_substitute_parameters_simple(self):
         """Test simple parameter substitution."""
         content = "Hello ${input:name}!"
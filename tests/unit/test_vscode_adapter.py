@@ -6,6 +6,7 @@ import tempfile
 import unittest
 from pathlib import Path
 import pytest
+import requests
 from unittest.mock import patch, MagicMock
 from apm_cli.adapters.client.vscode import VSCodeClientAdapter
 
@@ -191,6 +192,48 @@ class TestVSCodeClientAdapter(unittest.TestCase):
         self.assertEqual(updated_config["servers"]["fetch"]["command"], "npx")
         self.assertEqual(updated_config["servers"]["fetch"]["args"], ["@mcp/fetch"])
     
+    @patch("apm_cli.adapters.client.vscode.VSCodeClientAdapter.get_config_path")
+    def test_configure_mcp_servers(self, mock_get_path):
+        """Test configuring several MCP servers with a single write."""
+        mock_get_path.return_value = self.temp_path
+        self.mock_registry.find_servers_by_reference.return_value = {
+            "fetch": self.server_info,
+            "unknown-server": None,
+            "other": self.server_info,
+        }
+        adapter = VSCodeClientAdapter()
+        
+        with patch.object(adapter, "update_config", wraps=adapter.update_config) as mock_update:
+            configured = adapter.configure_mcp_servers(["fetch", "unknown-server", "other"])
+        
+        with open(self.temp_path, "r") as f:
+            updated_config = json.load(f)
+        
+        self.assertEqual(configured, ["fetch", "other"])
+        self.mock_registry.find_servers_by_reference.assert_called_once_with(
+            ["fetch", "unknown-server", "other"]
+        )
+        mock_update.assert_called_once()
+        self.assertEqual(set(updated_config["servers"]), {"fetch", "other"})
+        self.assertEqual(updated_config["servers"]["other"]["command"], "npx")
+    
+    @patch("apm_cli.adapters.client.vscode.VSCodeClientAdapter.get_config_path")
+    def test_configure_mcp_servers_registry_error(self, mock_get_path):
+        """Test a registry failure is reported with its own message, not as a missing server."""
+        mock_get_path.return_value = self.temp_path
+        self.mock_registry.find_servers_by_reference.return_value = {
+            "fetch": requests.ConnectionError("Registry unreachable"),
+        }
+        adapter = VSCodeClientAdapter()
+        
+        with patch("builtins.print") as mock_print:
+            configured = adapter.configure_mcp_servers(["fetch"])
+        
+        self.assertEqual(configured, [])
+        message = mock_print.call_args[0][0]
+        self.assertIn("Registry unreachable", message)
+        self.assertNotIn("not found", message)
+    
     @patch("apm_cli.adapters.client.vscode.VSCodeClientAdapter.get_config_path")
     def test_configure_mcp_server_empty_url(self, mock_get_path):
         """Test configuring an MCP server with empty URL."""
@@ -222,6 +265,30 @@ class TestVSCodeClientAdapter(unittest.TestCase):
         
         self.assertIn("Failed to retrieve server details for 'unknown-server'. Server not found in registry.", str(context.exception))
     
+    def test_format_server_config_package_kinds(self):
+        """Test server config formatting for docker and Python packages."""
+        adapter = VSCodeClientAdapter()
+        
+        docker_config, _ = adapter._format_server_config({
+            "name": "fetch",
+            "packages": [{"name": "mcp/fetch", "runtime_hint": "docker"}]
+        })
+        self.assertEqual(docker_config, {
+            "type": "stdio",
+            "command": "docker",
+            "args": ["run", "-i", "--rm", "mcp/fetch"]
+        })
+        
+        python_config, _ = adapter._format_server_config({
+            "name": "fetch",
+            "packages": [{"name": "mcp-server-fetch", "registry_name": "pypi"}]
+        })
+        self.assertEqual(python_config, {
+            "type": "stdio",
+            "command": "python3",
+            "args": ["-m", "mcp_server_fetch"]
+        })
+    
     @patch("os.getcwd")
     def test_get_config_path_repository(self, mock_getcwd):
         """Test getting the config path in the repository."""
@@ -1,5 +1,6 @@
 """Unit tests for workflow functionality."""
 
+import io
 import os
 import tempfile
 import unittest
@@ -7,8 +8,12 @@ import time
 import shutil
 import gc
 import sys
+from unittest.mock import patch
 from apm_cli.workflow.parser import WorkflowDefinition, parse_workflow_file
-from apm_cli.workflow.runner import substitute_parameters, collect_parameters
+from apm_cli.workflow.runner import (
+    substitute_parameters, collect_parameters, find_workflow_by_name, clear_workflow_cache,
+    run_workflow, preview_workflow
+)
 from apm_cli.workflow.discovery import discover_workflows, create_workflow_template
 
 
@@ -90,6 +95,24 @@ input:
         self.assertEqual(workflow.input_parameters, ["param1", "param2"])
         self.assertIn("# Test Workflow", workflow.content)
     
+    def test_parse_workflow_file_yaml_fallback(self):
+        """Test frontmatter outside the simple subset is still parsed as YAML."""
+        with open(self.temp_path, "w") as f:
+            f.write("""---
+description: "Quoted: description"
+llm: 1.5
+input: [param1, param2]
+---
+# Test Workflow
+""")
+        
+        workflow = parse_workflow_file(self.temp_path)
+        
+        self.assertEqual(workflow.description, "Quoted: description")
+        self.assertEqual(workflow.llm_model, 1.5)
+        self.assertEqual(workflow.input_parameters, ["param1", "param2"])
+        self.assertEqual(workflow.content, "# Test Workflow")
+    
     def test_workflow_validation(self):
         """Test workflow validation."""
         # Valid workflow
@@ -153,6 +176,53 @@ class TestWorkflowRunner(unittest.TestCase):
         
         result = substitute_parameters(content, params)
         self.assertEqual(result, "This is a test with value1 and ${input:param2}.")
+    
+    def test_parameter_substitution_literal_values(self):
+        """Test values are inserted literally and repeated placeholders all replaced."""
+        content = "${input:path} then ${input:a.b} then ${input:path}"
+        params = {
+            "path": r"C:\new\1",
+            "a.b": 2,
+            "ab": "unused"
+        }
+        
+        result = substitute_parameters(content, params)
+        self.assertEqual(result, r"C:\new\1 then 2 then C:\new\1")
+    
+    def test_collect_parameters_prompts_missing_in_order(self):
+        """Test missing parameters are prompted for, for list and dict declarations."""
+        for input_parameters in (["a", "b", "c"], {"a": {}, "b": {}, "c": {}}):
+            workflow = WorkflowDefinition(
+                "test", "test.prompt.md",
+                {"description": "Test", "input": input_parameters},
+                "content"
+            )
+            
+            with patch("builtins.input", side_effect=["value-a", "value-c"]) as mock_input:
+                params = collect_parameters(workflow, {"b": "given"})
+            
+            self.assertEqual(params, {"a": "value-a", "b": "given", "c": "value-c"})
+            self.assertEqual(mock_input.call_count, 2)
+    
+    def test_collect_parameters_piped_stdin(self):
+        """Test missing parameters are read line by line from piped stdin, with prompts."""
+        workflow = WorkflowDefinition(
+            "test", "test.prompt.md",
+            {"description": "Test", "input": ["a", "b"]},
+            "content"
+        )
+        
+        with patch("sys.stdin", io.StringIO("value-a\nvalue-b\nleft over\n")), \
+                patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+            params = collect_parameters(workflow, {})
+        
+        self.assertEqual(params, {"a": "value-a", "b": "value-b"})
+        self.assertIn("  a: ", mock_stdout.getvalue())
+        self.assertIn("  b: ", mock_stdout.getvalue())
+        
+        with patch("sys.stdin", io.StringIO("value-a\n")), patch("sys.stdout", new_callable=io.StringIO):
+            with self.assertRaises(EOFError):
+                collect_parameters(workflow, {})
 
 
 class TestWorkflowDiscovery(unittest.TestCase):
@@ -213,6 +283,99 @@ input:
         self.assertIn("workflow1", [w.name for w in workflows])
         self.assertIn("workflow2", [w.name for w in workflows])
     
+    def test_discover_workflows_skips_hidden_and_node_modules(self):
+        """Test discovery finds nested workflows but prunes hidden dirs and node_modules."""
+        for sub_dir in ("nested", ".hidden", "node_modules"):
+            dir_path = os.path.join(self.temp_dir_path, sub_dir)
+            os.makedirs(dir_path, exist_ok=True)
+            with open(os.path.join(dir_path, f"{sub_dir.lstrip('.')}.prompt.md"), "w") as f:
+                f.write("---\ndescription: Extra\n---\n# Extra\n")
+        
+        workflows = discover_workflows(self.temp_dir_path)
+        
+        self.assertEqual(
+            sorted(w.name for w in workflows),
+            ["nested", "workflow1", "workflow2"]
+        )
+    
+    def test_find_workflow_by_name_cached(self):
+        """Test name lookups reuse discovery and still see added workflows."""
+        clear_workflow_cache()
+        with patch("apm_cli.workflow.runner.discover_workflows", wraps=discover_workflows) as mock_discover:
+            self.assertEqual(find_workflow_by_name("workflow1", self.temp_dir_path).name, "workflow1")
+            self.assertEqual(find_workflow_by_name("workflow2", self.temp_dir_path).name, "workflow2")
+            self.assertEqual(mock_discover.call_count, 1)
+            
+            create_workflow_template("workflow3", self.temp_dir_path)
+            self.assertEqual(find_workflow_by_name("workflow3", self.temp_dir_path).name, "workflow3")
+            self.assertIsNone(find_workflow_by_name("missing", self.temp_dir_path))
+        clear_workflow_cache()
+    
+    def test_find_workflow_by_name_miss_keeps_other_directories(self):
+        """Test a name miss rediscovers only its own directory."""
+        clear_workflow_cache()
+        other_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, other_dir, ignore_errors=True)
+        create_workflow_template("other-workflow", other_dir)
+        
+        with patch("apm_cli.workflow.runner.discover_workflows", wraps=discover_workflows) as mock_discover:
+            self.assertEqual(find_workflow_by_name("other-workflow", other_dir).name, "other-workflow")
+            self.assertIsNone(find_workflow_by_name("missing", self.temp_dir_path))
+            self.assertEqual(find_workflow_by_name("other-workflow", other_dir).name, "other-workflow")
+        
+        # other_dir once, then self.temp_dir_path twice for the miss
+        self.assertEqual(
+            [call.args[0] for call in mock_discover.call_args_list],
+            [other_dir, self.temp_dir_path, self.temp_dir_path],
+        )
+        clear_workflow_cache()
+    
+    def test_run_workflow_keeps_caller_params(self):
+        """Test runtime options are split off without mutating the caller's params."""
+        params = {"param1": "value1", "_runtime": "llm", "_llm": "gpt-4o-mini"}
+        
+        with patch("apm_cli.workflow.runner.RuntimeFactory") as mock_factory:
+            mock_factory.runtime_exists.return_value = True
+            mock_factory.create_runtime.return_value.execute_prompt.side_effect = lambda content: content
+            success, result = run_workflow("workflow1", params, self.temp_dir_path)
+        
+        self.assertTrue(success)
+        self.assertEqual(result, "# Workflow 1")
+        mock_factory.create_runtime.assert_called_once_with("llm", "gpt-4o-mini")
+        self.assertEqual(params, {"param1": "value1", "_runtime": "llm", "_llm": "gpt-4o-mini"})
+    
+    def test_find_workflow_by_path(self):
+        """Test file path lookups parse the file directly and skip discovery."""
+        with patch("apm_cli.workflow.runner.discover_workflows") as mock_discover:
+            workflow = find_workflow_by_name(
+                os.path.join(".github", "prompts", "workflow1.prompt.md"), self.temp_dir_path
+            )
+            missing = find_workflow_by_name("missing.prompt.md", self.temp_dir_path)
+        
+        self.assertEqual(workflow.name, "workflow1")
+        self.assertIsNone(missing)
+        mock_discover.assert_not_called()
+    
+    def test_preview_workflow_validates_once(self):
+        """Test repeated previews of a cached workflow reuse its validation."""
+        clear_workflow_cache()
+        with patch.object(WorkflowDefinition, "validate", return_value=[]) as mock_validate:
+            for _ in range(3):
+                success, _ = preview_workflow("workflow1", {"param1": "value1"}, self.temp_dir_path)
+                self.assertTrue(success)
+        
+        mock_validate.assert_called_once()
+        clear_workflow_cache()
+    
+    def test_discover_workflows_skips_unparsable(self):
+        """Test discovering workflows skips files that fail to parse."""
+        with open(os.path.join(self.prompts_dir, "broken.prompt.md"), "w") as f:
+            f.write("---\ndescription: [unclosed\n---\n# Broken\n")
+        
+        workflows = discover_workflows(self.temp_dir_path)
+        
+        self.assertEqual(sorted(w.name for w in workflows), ["workflow1", "workflow2"])
+    
     def test_create_workflow_template(self):
         """Test creating a workflow template."""
         template_path = create_workflow_template("test-template", self.temp_dir_path)